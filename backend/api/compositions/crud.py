@@ -12,6 +12,7 @@ Key Operations:
 - POST /compositions/{id}/save - Save composition to disk
 - DELETE /compositions/{id} - Delete composition
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 
@@ -87,7 +88,8 @@ async def create_composition(
         composition.metadata = {"source": "create_composition", "initial": True}
 
         # Save initial composition to disk
-        composition_service.save_composition(
+        await asyncio.to_thread(
+            composition_service.save_composition,
             composition=composition,
             create_history=True,  # Create initial history entry
             is_autosave=False
@@ -137,7 +139,8 @@ async def save_composition(
         composition.metadata = request.metadata or {"source": "manual_save" if not request.is_autosave else "autosave"}
 
         # Save composition
-        composition_service.save_composition(
+        await asyncio.to_thread(
+            composition_service.save_composition,
             composition=composition,
             create_history=request.create_history,
             is_autosave=request.is_autosave
@@ -199,7 +202,9 @@ async def get_composition(
     This is what you call to "open" a composition.
     """
     try:
-        composition = composition_service.load_composition(composition_id, use_autosave=use_autosave)
+        composition = composition_service.load_composition(
+            composition_id, use_autosave=use_autosave, with_chat=True
+        )
         if not composition:
             raise ResourceNotFoundError(f"Composition {composition_id} not found")
 
@@ -308,7 +313,8 @@ async def create_history_snapshot(
             raise ResourceNotFoundError(f"Composition {composition_id} not found")
 
         # Save with history entry
-        composition_service.save_composition(
+        await asyncio.to_thread(
+            composition_service.save_composition,
             composition=composition,
             create_history=True,
             is_autosave=False
@@ -3,6 +3,7 @@ Composition History Operations - Version management and restoration
 
 This module handles composition version history, restoration, and autosave recovery.
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 
@@ -128,7 +129,7 @@ async def recover_from_autosave(
     """
     try:
         # Load autosave
-        composition = composition_service.load_composition(composition_id, use_autosave=True)
+        composition = composition_service.load_composition(composition_id, use_autosave=True, with_chat=True)
         if not composition:
             raise ResourceNotFoundError(f"No autosave found for composition {composition_id}")
 
@@ -145,7 +146,8 @@ async def recover_from_autosave(
             raise ServiceError(f"Failed to restore autosave to services")
 
         # Save as current (creates history entry)
-        composition_service.save_composition(
+        await asyncio.to_thread(
+            composition_service.save_composition,
             composition=composition,
             create_history=True,
             is_autosave=False
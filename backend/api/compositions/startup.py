@@ -3,6 +3,7 @@ Composition Startup Operations - App initialization and bulk loading
 
 This module handles loading all compositions into memory on app startup.
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 
@@ -48,11 +49,16 @@ async def load_all_compositions(
         loaded_count = 0
         first_composition_id = None
 
-        for comp_meta in compositions:
-            composition_id = comp_meta["id"]
+        # Read and parse every composition from disk in worker threads so file
+        # reads overlap; restoring into the services below stays sequential
+        loaded = await asyncio.gather(*(
+            asyncio.to_thread(composition_service.load_composition, comp_meta.id, with_chat=True)
+            for comp_meta in compositions
+        ))
+
+        for comp_meta, composition in zip(compositions, loaded):
+            composition_id = comp_meta.id
 
-            # Load composition from disk
-            composition = composition_service.load_composition(composition_id)
             if not composition:
                 logger.warning(f"⚠️ Failed to load composition {composition_id}")
                 continue
@@ -234,7 +234,7 @@ async def delete_track(
         # UNDO: Push current state to undo stack BEFORE mutation
         composition_state_service.push_undo(composition_id)
 
-        success = composition_state_service.delete_track(track_id)
+        success = composition_state_service.delete_track(track_id, composition_id)
         if not success:
             raise ResourceNotFoundError(f"Track {track_id} not found")
 
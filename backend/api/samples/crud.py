@@ -29,6 +29,9 @@ from .utils import get_samples_dir, get_metadata_file, load_metadata, save_metad
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Uploads are streamed to disk in chunks of this size (bytes)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 # ============================================================================
 # RESPONSE MODELS
@@ -84,9 +87,10 @@ async def upload_sample(
         temp_file_name = f"{sample_id}_temp{file_ext}"
         temp_file_path = os.path.join(samples_dir, temp_file_name)
 
-        content = await file.read()
+        # Stream to disk instead of holding the whole upload in memory
         with open(temp_file_path, 'wb') as f:
-            f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
         # Convert to WAV if needed (SuperCollider only supports WAV, AIFF, FLAC)
         if file_ext.lower() in ['.webm', '.mp3', '.m4a', '.aac']:
@@ -279,6 +279,10 @@ async def shutdown_services() -> None:
     # NOTE: Autosave promotion now handled by CompositionService
     # No need to manually promote autosaves anymore
 
+    # Flush any debounced auto-persist writes before exit
+    if _composition_service:
+        _composition_service.flush_pending_persists()
+
     # Stop monitoring services
     if _audio_analyzer:
         await _audio_analyzer.stop_monitoring()
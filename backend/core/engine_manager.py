@@ -9,12 +9,75 @@ ARCHITECTURE:
 """
 import logging
 import asyncio
-from typing import Optional
+import queue
+import struct
+import threading
+from typing import Optional, List, Tuple
 from pythonosc import udp_client, dispatcher, osc_server
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
 from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.parsing import osc_types
 
 logger = logging.getLogger(__name__)
 
+# OSC packets waiting for the writer thread before new sends are dropped.
+# Releases and frees (/n_set gate 0, /n_free) are always queued past this
+# limit, since dropping one leaves a note hanging.
+OSC_SEND_QUEUE_SIZE = 4096
+
+# samplePlayer controls in /s_new order with their fixed OSC type ("i" or "f")
+SAMPLE_PLAYER_CONTROLS = (
+    ("bufnum", "i"),
+    ("rate", "f"),
+    ("amp", "f"),
+    ("startPos", "f"),
+    ("endPos", "f"),
+    ("fadeIn", "f"),
+    ("fadeOut", "f"),
+    ("reverse", "i"),
+    ("loop", "i"),
+    ("gate", "i"),
+    ("out", "i"),
+)
+
+
+def _is_release(address: str, args) -> bool:
+    """True for messages that end a node: /n_free, or /n_set with gate 0"""
+    if address == "/n_free":
+        return True
+    if address != "/n_set":
+        return False
+    args = list(args)
+    return any(name == "gate" and value == 0 for name, value in zip(args[1::2], args[2::2]))
+
+
+class _OscDatagram:
+    """Pre-encoded OSC packet in the shape python-osc's client.send() expects"""
+    __slots__ = ("dgram",)
+
+    def __init__(self, dgram: bytes):
+        self.dgram = dgram
+
+
+def _build_s_new_template(synthdef: str, controls: Tuple[Tuple[str, str], ...]) -> Tuple[bytes, struct.Struct, Tuple[bytes, ...]]:
+    """
+    Pre-encode the fixed parts of an /s_new message for one synthdef
+
+    The address, type-tag string, synthdef name and control names never change,
+    so only node id, placement and control values are packed per call.
+
+    Returns:
+        (header bytes, struct packing the variable part, encoded control names)
+    """
+    type_tags = ",siii" + "".join(f"s{osc_type}" for _, osc_type in controls)
+    header = osc_types.write_string("/s_new") + osc_types.write_string(type_tags) + osc_types.write_string(synthdef)
+    names = tuple(osc_types.write_string(name) for name, _ in controls)
+    layout = ">iii" + "".join(f"{len(name)}s{osc_type}" for name, (_, osc_type) in zip(names, controls))
+    return header, struct.Struct(layout), names
+
+
+SAMPLE_PLAYER_HEADER, SAMPLE_PLAYER_STRUCT, SAMPLE_PLAYER_NAMES = _build_s_new_template("samplePlayer", SAMPLE_PLAYER_CONTROLS)
+
 
 class AudioEngineManager:
     """
@@ -31,6 +94,19 @@ class AudioEngineManager:
         self.osc_server: Optional[osc_server.AsyncIOOSCUDPServer] = None
         self.is_connected = False
         self.next_node_id = 3000  # Start user synths at 3000 (1000-2999 reserved for system)
+
+        # Outgoing OSC packets are built on the caller's thread and written to the
+        # socket by a dedicated writer thread, so a blocked sendto never stalls
+        # the event loop (None is the shutdown sentinel). The queue is unbounded;
+        # OSC_SEND_QUEUE_SIZE is enforced in _enqueue for droppable packets only.
+        self._send_queue: "queue.Queue[Optional[object]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Send failures, reported to the UI with the transport state: packets
+        # dropped on a full queue, and socket errors from the writer thread
+        self.dropped_send_count = 0
+        self.send_error_count = 0
+        self.last_send_error: Optional[Exception] = None
         
         # Callbacks for audio data (output monitoring)
         self.on_waveform_data = None
@@ -52,6 +128,7 @@ class AudioEngineManager:
             
             # Create OSC client to send commands to scsynth (port 57110)
             self.scsynth_client = udp_client.SimpleUDPClient("127.0.0.1", 57110)
+            self._start_writer()
             
             # Create OSC server to receive data from sclang (port 57121)
             disp = dispatcher.Dispatcher()
@@ -92,7 +169,55 @@ class AudioEngineManager:
             except:
                 pass
         self.is_connected = False
+        # Joining the writer can take up to a second; keep it off the event loop
+        await asyncio.to_thread(self._stop_writer)
         logger.info("🔌 Disconnected from SuperCollider")
+
+    def _start_writer(self):
+        """Start the OSC writer thread if it isn't running"""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="osc-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _stop_writer(self):
+        """Let the writer thread drain queued packets and exit"""
+        if not self._writer_thread:
+            return
+        self._send_queue.put(None)
+        self._writer_thread.join(timeout=1.0)
+        self._writer_thread = None
+
+    def _writer_loop(self):
+        """Writer thread: send queued OSC packets to scsynth in order"""
+        while True:
+            content = self._send_queue.get()
+            if content is None:
+                return
+            try:
+                self.scsynth_client.send(content)
+            except Exception as e:
+                self.send_error_count += 1
+                self.last_send_error = e
+                logger.error(f"❌ Failed to send OSC packet: {e}")
+
+    def _enqueue(self, content, must_deliver: bool = False) -> None:
+        """
+        Hand a built OSC message/bundle to the writer thread
+
+        Past OSC_SEND_QUEUE_SIZE the packet is dropped and counted in
+        dropped_send_count, unless it must be delivered.
+
+        Args:
+            content: Built message, bundle or _OscDatagram
+            must_deliver: Queue even past OSC_SEND_QUEUE_SIZE (releases and frees)
+        """
+        if not must_deliver and self._send_queue.qsize() >= OSC_SEND_QUEUE_SIZE:
+            self.dropped_send_count += 1
+            if self.dropped_send_count == 1 or self.dropped_send_count % 100 == 0:
+                logger.warning(f"⚠️ OSC send queue full, dropped {self.dropped_send_count} packet(s)")
+            return
+        self._send_queue.put(content)
     
     def send_message(self, address: str, *args):
         """Send OSC message to scsynth"""
@@ -103,17 +228,81 @@ class AudioEngineManager:
             # Convert args tuple to list for python-osc
             args_list = list(args) if args else []
 
-            # Log ALL OSC messages for debugging
-            logger.info(f"📤 OSC → {address} {args_list}")
+            # Log ALL OSC messages for debugging (formatted only when DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📤 OSC → {address} {args_list}")
 
-            # Send to SuperCollider
-            self.scsynth_client.send_message(address, args_list)
+            # Build here, send from the writer thread
+            builder = OscMessageBuilder(address=address)
+            for arg in args_list:
+                builder.add_arg(arg)
+            self._enqueue(builder.build(), must_deliver=_is_release(address, args_list))
 
         except Exception as e:
             logger.error(f"❌ Failed to send OSC message {address} {args_list}: {e}")
             logger.error(f"   Args type: {type(args)}, Args list type: {type(args_list)}")
             raise
     
+    def send_bundle(self, timetag: Optional[float], messages: List[Tuple[str, list]]):
+        """
+        Send OSC messages to scsynth as one timestamped bundle
+
+        scsynth executes the bundle sample-accurately at the given time, so
+        events scheduled ahead don't depend on Python's timing.
+
+        Args:
+            timetag: Unix time (time.time() clock) to execute at, or None for immediately
+            messages: (address, args) pairs
+        """
+        if not self.scsynth_client or not self.is_connected:
+            raise RuntimeError("Not connected to SuperCollider")
+
+        try:
+            bundle = OscBundleBuilder(IMMEDIATELY if timetag is None else timetag)
+            for address, args in messages:
+                builder = OscMessageBuilder(address=address)
+                for arg in args:
+                    builder.add_arg(arg)
+                bundle.add_content(builder.build())
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📤 OSC bundle @ {timetag} → {messages}")
+
+            must_deliver = any(_is_release(address, args) for address, args in messages)
+            self._enqueue(bundle.build(), must_deliver=must_deliver)
+
+        except Exception as e:
+            logger.error(f"❌ Failed to send OSC bundle ({len(messages)} messages): {e}")
+            raise
+
+    def send_sample_player(self, node_id: int, add_action: int, target: int,
+                           bufnum: int, rate: float, amp: float, start_pos: float, end_pos: float,
+                           fade_in: float, fade_out: float, reverse: int, loop: int, gate: int, out: int):
+        """
+        Send /s_new for a samplePlayer synth from the pre-encoded template
+
+        Equivalent to send_message("/s_new", "samplePlayer", node_id, add_action, target,
+        "bufnum", bufnum, ...) but skips per-call type-tag and string encoding.
+        """
+        if not self.scsynth_client or not self.is_connected:
+            raise RuntimeError("Not connected to SuperCollider")
+
+        values = (bufnum, rate, amp, start_pos, end_pos, fade_in, fade_out, reverse, loop, gate, out)
+        try:
+            fields = [node_id, add_action, target]
+            for name, (_, osc_type), value in zip(SAMPLE_PLAYER_NAMES, SAMPLE_PLAYER_CONTROLS, values):
+                fields.append(name)
+                fields.append(int(value) if osc_type == "i" else float(value))
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📤 OSC → /s_new samplePlayer {node_id} {values}")
+
+            self._enqueue(_OscDatagram(SAMPLE_PLAYER_HEADER + SAMPLE_PLAYER_STRUCT.pack(*fields)))
+
+        except Exception as e:
+            logger.error(f"❌ Failed to send samplePlayer /s_new for node {node_id}: {e}")
+            raise
+
     def allocate_node_id(self) -> int:
         """Allocate a new node ID for a synth"""
         node_id = self.next_node_id
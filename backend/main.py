@@ -31,6 +31,7 @@ from backend.api.audio import router as audio_router
 from backend.api.playback import router as playback_router
 from backend.api.assistant import router as assistant_router
 from backend.api.samples import router as samples_router
+from backend.services.audio.sample_metadata import flush_metadata as flush_sample_metadata
 from backend.api.compositions import router as compositions_router
 from backend.api.collections import router as collections_router
 
@@ -110,6 +111,7 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup using centralized shutdown
         await shutdown_services()
+        flush_sample_metadata()
         logger.info("✅ Sonic Claude Backend shut down")
 
 
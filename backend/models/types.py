@@ -1,8 +1,8 @@
 """
 Type definitions for improved type safety across the backend
 
-This module provides TypedDict definitions to replace Dict[str, Any] usage
-and improve IDE support and type checking.
+This module provides TypedDict definitions (and slotted records for hot-path
+data) to replace Dict[str, Any] usage and improve IDE support and type checking.
 """
 from typing import TypedDict, Optional, List
 
@@ -16,12 +16,20 @@ class SynthInfo(TypedDict):
     bus: Optional[int]
 
 
-class ActiveMIDINote(TypedDict):
-    """Information about an active MIDI note"""
-    clip_id: str
-    note: int
-    start_time: float  # Position in clip (beats) - uniquely identifies the note instance
-    wall_time: float  # Wall clock time for debugging
+class ActiveMIDINote:
+    """
+    Information about an active MIDI note
+
+    A __slots__ record rather than a dict: one is created per scheduled note,
+    so it avoids a per-instance __dict__.
+    """
+    __slots__ = ("clip_id", "note", "start_time", "wall_time")
+
+    def __init__(self, clip_id: str, note: int, start_time: float, wall_time: float):
+        self.clip_id = clip_id
+        self.note = note
+        self.start_time = start_time  # Position in clip (beats) - uniquely identifies the note instance
+        self.wall_time = wall_time  # Wall clock time for debugging
 
 
 class PlaybackState(TypedDict):
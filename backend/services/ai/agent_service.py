@@ -937,7 +937,8 @@ class AIAgentService:
             captured_composition.chat_history = self.chat_histories.get(composition_id, [])
 
             # Save with history
-            self.composition_service.save_composition(
+            await asyncio.to_thread(
+                self.composition_service.save_composition,
                 composition=captured_composition,
                 create_history=True,  # Create history entry for AI iteration
                 is_autosave=False
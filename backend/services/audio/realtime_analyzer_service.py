@@ -48,6 +48,9 @@ class RealtimeAudioAnalyzer:
         self.on_spectrum_update: Optional[Callable] = None
         self.on_meter_update: Optional[Callable] = None
 
+        # Hann windows by block length (sclang always sends the same size)
+        self._hann_windows: Dict[int, np.ndarray] = {}
+
         # Register callbacks with engine manager
         engine_manager.on_waveform_data = self._handle_waveform_data
         engine_manager.on_spectrum_data = self._handle_spectrum_data
@@ -170,15 +173,18 @@ class RealtimeAudioAnalyzer:
 
             # Compute FFT spectrum from waveform
             # Apply Hann window to reduce spectral leakage
-            window = np.hanning(len(waveform))
-            windowed = waveform * window
+            # (in place - samples_list already holds the unwindowed copy)
+            window = self._hann_window(len(waveform))
+            np.multiply(waveform, window, out=waveform)
 
             # Compute FFT
-            fft_result = np.fft.rfft(windowed)
-            magnitudes = np.abs(fft_result)
+            fft_result = np.fft.rfft(waveform)
+            magnitudes_db = np.abs(fft_result)
 
-            # Convert to dB
-            magnitudes_db = 20 * np.log10(np.maximum(magnitudes, 1e-10))
+            # Convert to dB (in place on the magnitude buffer)
+            np.maximum(magnitudes_db, 1e-10, out=magnitudes_db)
+            np.log10(magnitudes_db, out=magnitudes_db)
+            magnitudes_db *= 20
 
             # Send spectrum to frontend (async)
             # Frontend expects: {type: "spectrum", magnitudes: []}
@@ -190,6 +196,13 @@ class RealtimeAudioAnalyzer:
         except Exception as e:
             logger.error(f"❌ Error processing waveform data: {e}")
 
+    def _hann_window(self, size: int) -> np.ndarray:
+        """Get a cached float32 Hann window of the given length"""
+        window = self._hann_windows.get(size)
+        if window is None:
+            window = self._hann_windows[size] = np.hanning(size).astype(np.float32)
+        return window
+
     def _handle_spectrum_data(self, samples: List[float]) -> None:
         """
         Handle spectrum data from sclang (NOT USED - we compute FFT from waveform)
@@ -0,0 +1,112 @@
+"""
+Sample Metadata - Cached, debounced access to samples/metadata.json
+
+Shared by the samples API and the services that resolve sample IDs, so both
+see the same pending (not yet flushed) edits.
+"""
+import copy
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Debounce window for coalescing metadata.json writes (seconds)
+METADATA_FLUSH_DELAY_SECONDS = 0.2
+
+# Parsed metadata per file, keyed on (mtime_ns, size) so edits on disk invalidate it
+_metadata_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+# Metadata saved but not yet written: bursts of mutations become one write per file
+_pending_metadata: Dict[str, dict] = {}
+_pending_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+def load_metadata(metadata_file: str) -> dict:
+    """
+    Load sample metadata from JSON file
+
+    The parsed dict is cached until the file changes on disk. Each call
+    returns a private copy, so a change that is abandoned before
+    save_metadata() never leaks into later loads.
+    """
+    with _pending_lock:
+        pending = _pending_metadata.get(metadata_file)
+        if pending is not None:
+            return copy.deepcopy(pending)
+
+    try:
+        st = os.stat(metadata_file)
+    except FileNotFoundError:
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _metadata_cache.get(metadata_file)
+    if cached and cached[0] == key:
+        return copy.deepcopy(cached[1])
+
+    try:
+        with open(metadata_file, 'rb') as f:
+            metadata = orjson.loads(f.read())
+    except Exception as e:
+        logger.error(f"Failed to load metadata: {e}")
+        return {}
+
+    _metadata_cache[metadata_file] = (key, metadata)
+    return copy.deepcopy(metadata)
+
+
+def save_metadata(metadata: dict, metadata_file: str):
+    """
+    Save sample metadata to JSON file
+
+    The write is debounced by METADATA_FLUSH_DELAY_SECONDS so rapid edits are
+    coalesced; load_metadata() sees the new state immediately. Call
+    flush_metadata() at sync points (shutdown, tests).
+    """
+    global _flush_timer
+    with _pending_lock:
+        _pending_metadata[metadata_file] = metadata
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(METADATA_FLUSH_DELAY_SECONDS, flush_metadata)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_metadata() -> None:
+    """Write all pending metadata files to disk"""
+    global _flush_timer
+    with _pending_lock:
+        pending = list(_pending_metadata.items())
+        _pending_metadata.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+
+    for metadata_file, metadata in pending:
+        try:
+            _write_metadata(metadata, metadata_file)
+        except Exception as e:
+            logger.error(f"Failed to save metadata: {e}")
+
+
+def _write_metadata(metadata: dict, metadata_file: str):
+    """Write sample metadata to JSON file (atomically, via temp file + os.replace)"""
+    temp_file = f"{metadata_file}.tmp"
+    try:
+        payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str)
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_file, metadata_file)
+    except Exception as e:
+        _metadata_cache.pop(metadata_file, None)
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+        raise e
+
+    st = os.stat(metadata_file)
+    _metadata_cache[metadata_file] = ((st.st_mtime_ns, st.st_size), metadata)
@@ -12,19 +12,80 @@ Key Concepts:
 - History = multiple saved versions of the same Composition
 - Simple save/load operations (no conversion needed)
 """
+import hashlib
 import logging
-import json
+import mmap
+import os
+import re
 import shutil
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import uuid
-
-from backend.models.composition import Composition, CompositionMetadata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import orjson
+
+try:
+    import bsdiff4
+    BSDIFF_AVAILABLE = True
+except ImportError:
+    BSDIFF_AVAILABLE = False
+    logging.warning("bsdiff4 not available - composition history will store full snapshots")
+
+try:
+    import jsonpatch
+    JSONPATCH_AVAILABLE = True
+except ImportError:
+    JSONPATCH_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    logging.warning("zstandard not available - composition history will be stored uncompressed")
+
+from backend.models.composition import Composition, CompositionMetadata, ChatMessage
 
 logger = logging.getLogger(__name__)
 
 
+# Debounce window for coalescing auto-persist writes (seconds)
+AUTO_PERSIST_DEBOUNCE_SECONDS = 0.5
+
+# History delta encoding: a full snapshot (keyframe) every N versions bounds
+# how many patches a load has to apply; a delta is only kept when it is
+# smaller than this fraction of the full snapshot
+HISTORY_KEYFRAME_INTERVAL = 10
+HISTORY_MAX_DELTA_RATIO = 0.5
+
+# Composition files are written in slices of this size (bytes)
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are parsed through mmap instead of read() (bytes)
+MMAP_MIN_BYTES = 256 * 1024
+
+# Number of recently saved compositions whose current.json bytes stay in memory
+HOT_CACHE_SIZE = 8
+
+# Deleted composition directories are renamed with this prefix, then removed in the background
+TRASH_DIR_PREFIX = ".deleted-"
+
+# Top-level members of an indent=2 JSON object each start a line with exactly
+# two spaces and a quote (nested lines are indented further), so keyframes are
+# split here into byte-exact segments
+KEYFRAME_SEGMENT_RE = re.compile(rb'\n  "')
+
+# History filenames: <version>_<timestamp>.manifest.json / .json / .json.zst / .patch / .patch.json
+HISTORY_FILENAME_RE = re.compile(
+    r"^(\d+)(?:_([^.]*))?\.(?:manifest\.json|json|json\.zst|patch|patch\.json)$"
+)
+
+
 class CompositionService:
     """
     Unified composition storage - ONE system for ALL composition data
@@ -34,12 +95,18 @@ class CompositionService:
         compositions/
             <composition_id>/
                 current.json           # Current complete state
-                metadata.json          # Composition metadata
+                metadata.json          # Listing metadata sidecar (kept in sync with current.json)
+                chat_history.json      # AI chat history (kept out of current.json, loaded on demand)
                 history/
-                    000_original.json  # Original state
-                    001_<timestamp>.json  # First save/iteration
-                    002_<timestamp>.json  # Second save/iteration
+                    000_<timestamp>.manifest.json  # Original state
+                    001_<timestamp>.patch # First save/iteration (bsdiff against 000)
+                    002_<timestamp>.patch # Second save/iteration (bsdiff against 001)
+                    003_<timestamp>.patch.json  # RFC 6902 JSON Patch (used when bsdiff4 is missing)
                     ...
+                    010_<timestamp>.manifest.json  # Keyframe (chunk hashes per top-level field)
+                    objects/
+                        <sha256>.json.zst  # Content-addressed chunk shared across keyframes
+                    .next              # Next version number
                 autosave.json          # Autosave backup
         samples/
             <sample_files>
@@ -55,11 +122,58 @@ class CompositionService:
         self.samples_dir = samples_dir
         self.cache_dir = samples_dir / "cache"
 
+        # History keyframe compression (zstd when available)
+        if ZSTD_AVAILABLE:
+            self._zstd = zstandard.ZstdCompressor(level=3)
+            self._zstd_d = zstandard.ZstdDecompressor()
+
+        # composition_id -> sha256 of the chat last written to / read from chat_history.json
+        self._chat_digests: Dict[str, bytes] = {}
+
+        # composition_id -> next history version number
+        self._next_version: Dict[str, int] = {}
+
+        # Serialized bytes of the newest history version, LRU-bounded, so the
+        # next delta is diffed against them instead of rebuilt from disk:
+        # composition_id -> (version, payload)
+        self._history_tail: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+
+        # composition_id -> storage directory Path
+        self._dir_cache: Dict[str, Path] = {}
+
+        # Hot cache of recently saved current.json bytes, LRU-bounded:
+        # composition_id -> (current.json mtime_ns, payload)
+        self._hot_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._hot_cache_lock = threading.Lock()
+
+        # Listing cache: composition_id -> (current.json mtime_ns, metadata)
+        self._metadata_cache: Dict[str, Tuple[int, CompositionMetadata]] = {}
+
+        # Auto-persist debounce: mutations within the window are coalesced
+        # into one durable write per composition
+        self._pending_persist: Dict[str, Composition] = {}
+        self._pending_lock = threading.Lock()
+
+        # Serializes save_composition across the event loop, worker and timer threads
+        self._save_lock = threading.RLock()
+
+        # batch(): nesting depth and files whose fsync is deferred to batch exit
+        self._batch_depth = 0
+        self._deferred_fsync: set = set()
+        self._flush_timer: Optional[threading.Timer] = None
+
         # Create directory structure
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.samples_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Use anonymous-inode writes where the platform/filesystem supports them
+        self._use_tmpfile = self._probe_tmpfile_support()
+
+        # Finish removing directories left behind by deletes interrupted at exit
+        for trash_dir in self.storage_dir.glob(f"{TRASH_DIR_PREFIX}*"):
+            self._remove_in_background(trash_dir)
+
         logger.info(f"✅ CompositionService initialized at {self.storage_dir}")
 
     def _get_composition_dir(self, composition_id: str, create: bool = False) -> Path:
@@ -70,7 +184,9 @@ class CompositionService:
             composition_id: Composition ID
             create: Whether to create the directory if it doesn't exist
         """
-        comp_dir = self.storage_dir / composition_id
+        comp_dir = self._dir_cache.get(composition_id)
+        if comp_dir is None:
+            comp_dir = self._dir_cache[composition_id] = self.storage_dir / composition_id
         if create:
             comp_dir.mkdir(exist_ok=True)
             (comp_dir / "history").mkdir(exist_ok=True)
@@ -85,15 +201,30 @@ class CompositionService:
         """
         Save complete composition state
 
+        Safe to call from worker threads (API handlers save via asyncio.to_thread,
+        auto-persist flushes from a timer thread); saves are serialized so history
+        version numbers are never handed out twice.
+
         Args:
             composition: Complete composition to save
             create_history: Whether to create a history entry
             is_autosave: Whether this is an autosave
         """
+        with self._save_lock:
+            self._write_composition(composition, create_history, is_autosave)
+
+    def _write_composition(self, composition: Composition, create_history: bool, is_autosave: bool) -> None:
+        """Write current/autosave JSON, sidecars and history entry (caller holds _save_lock)"""
         comp_dir = self._get_composition_dir(composition.id, create=True)
 
-        # Update timestamp
-        composition.updated_at = datetime.now()
+        # A direct save supersedes any queued auto-persist for this composition
+        if not is_autosave:
+            with self._pending_lock:
+                self._pending_persist.pop(composition.id, None)
+
+        # Update timestamp (captured once and shared with the history entry)
+        now, stamp = self._now_and_stamp()
+        composition.updated_at = now
 
         # Save current state
         if is_autosave:
@@ -101,55 +232,559 @@ class CompositionService:
         else:
             target_file = comp_dir / "current.json"
 
-        self._atomic_write(target_file, composition.model_dump(mode='json'))
+        # Serialize once in pydantic-core. chat_history lives in its own sidecar
+        # so every save doesn't rewrite it (history entries still carry it).
+        payload = composition.model_dump_json(indent=2, exclude={"chat_history"}).encode()
+        self._atomic_write_bytes(target_file, payload)
+        if not is_autosave:
+            self._save_chat_history(comp_dir, composition)
+
+        # Keep the listing sidecar and cache in sync with current.json
+        if not is_autosave:
+            fields = self._build_metadata(composition)
+            self._atomic_write(comp_dir / "metadata.json", fields)
+            st = target_file.stat()
+            self._metadata_cache[composition.id] = (st.st_mtime_ns, self._construct_metadata(
+                composition.id, st, (comp_dir / "autosave.json").exists(), fields
+            ))
+            self._remember_payload(composition.id, st.st_mtime_ns, payload)
 
         # Create history entry if requested
         if create_history and not is_autosave:
-            self._create_history_entry(composition)
+            self._create_history_entry(
+                composition, now=now, stamp=stamp,
+                payload=self._history_payload(comp_dir, composition)
+            )
 
         logger.info(f"💾 Saved composition {composition.id} ({'autosave' if is_autosave else 'manual'})")
 
-    def _create_history_entry(self, composition: Composition) -> None:
-        """Create a history entry for this save"""
+    def _save_chat_history(self, comp_dir: Path, composition: Composition) -> None:
+        """
+        Write the chat_history.json sidecar when the chat has changed
+
+        Compositions loaded without their chat (with_chat=False) never had
+        chat_history set, so their sidecar is left untouched. The serialized
+        chat is compared by digest, so edits and a cleared-then-regrown chat
+        are written while an unchanged one is skipped.
+        """
+        if "chat_history" not in composition.model_fields_set:
+            return
+
+        chat_bytes = self._serialize_chat(composition.chat_history)
+        digest = hashlib.sha256(chat_bytes).digest()
+        if self._chat_digests.get(composition.id) == digest:
+            return
+
+        self._atomic_write_bytes(comp_dir / "chat_history.json", chat_bytes)
+        self._chat_digests[composition.id] = digest
+
+    def _serialize_chat(self, chat: List[ChatMessage]) -> bytes:
+        """Serialize chat messages the way chat_history.json is stored"""
+        return self._serialize([message.model_dump(mode='json') for message in chat])
+
+    def _history_payload(self, comp_dir: Path, composition: Composition) -> bytes:
+        """
+        Serialize a composition for its history entry, chat included
+
+        current.json leaves the chat to its sidecar, but history snapshots
+        carry it so restoring a version restores that version's chat. When the
+        composition was loaded without its chat, the sidecar supplies it.
+        """
+        if "chat_history" not in composition.model_fields_set:
+            chat_file = comp_dir / "chat_history.json"
+            if chat_file.exists():
+                chat = [ChatMessage(**message) for message in self._load_json_mmap(chat_file)]
+                composition = composition.model_copy(update={"chat_history": chat})
+        return composition.model_dump_json(indent=2).encode()
+
+    def _build_metadata(self, composition: Composition) -> Dict[str, Any]:
+        """Build the metadata.json sidecar payload used by list_compositions"""
+        return {
+            "name": composition.name,
+            "tempo": composition.tempo,
+            "time_signature": composition.time_signature,
+            "created_at": composition.created_at.isoformat(),
+            "updated_at": composition.updated_at.isoformat(),
+            "track_count": len(composition.tracks),
+            "clip_count": len(composition.clips),
+            "duration_beats": max((c.start_time + c.duration for c in composition.clips), default=0.0),
+        }
+
+    def _now_and_stamp(self) -> Tuple[datetime, str]:
+        """Current time plus its history filename stamp (e.g. 20260218_143022)"""
+        now = datetime.now()
+        return now, f"{now:%Y%m%d_%H%M%S}"
+
+    def _create_history_entry(
+        self,
+        composition: Composition,
+        now: Optional[datetime] = None,
+        stamp: Optional[str] = None,
+        payload: Optional[bytes] = None
+    ) -> None:
+        """
+        Create a history entry for this save
+
+        Entries are stored as a bsdiff delta against the previous version when
+        that is substantially smaller, with a full snapshot (keyframe) every
+        HISTORY_KEYFRAME_INTERVAL versions. Keyframes are manifests of
+        content-addressed chunks, so unchanged fields are stored only once.
+
+        Args:
+            composition: Composition to record
+            now: Save time already captured by the caller
+            stamp: Filename stamp for `now` (computed if not given)
+            payload: Serialized composition already written by the caller
+        """
         comp_dir = self._get_composition_dir(composition.id, create=True)
         history_dir = comp_dir / "history"
 
-        # Find next version number
-        existing = sorted(history_dir.glob("*.json"))
-        next_num = len(existing)
+        # Find next version number (in-memory counter, seeded from history/.next)
+        next_num = self._next_version.get(composition.id)
+        if next_num is None:
+            next_num = self._read_next_version(history_dir)
 
         # Create filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{next_num:03d}_{timestamp}.json"
+        if stamp is None:
+            now = now or datetime.now()
+            stamp = f"{now:%Y%m%d_%H%M%S}"
+        if payload is None:
+            payload = composition.model_dump_json(indent=2).encode()
+
+        # Bytes a later load rebuilds for this version; the next delta must be
+        # diffed against exactly these
+        rebuilt = payload
+        patch = None
+        if (BSDIFF_AVAILABLE or JSONPATCH_AVAILABLE) and next_num % HISTORY_KEYFRAME_INTERVAL != 0:
+            prev_bytes = self._recall_history_tail(composition.id, next_num - 1)
+            if prev_bytes is None:
+                prev_bytes = self._read_history_bytes(history_dir, next_num - 1)
+            if prev_bytes is not None:
+                if BSDIFF_AVAILABLE:
+                    patch, patch_ext = bsdiff4.diff(prev_bytes, payload), "patch"
+                else:
+                    # Pure-Python fallback: structural diff of the parsed documents
+                    prev_data = orjson.loads(prev_bytes)
+                    ops = jsonpatch.make_patch(prev_data, orjson.loads(payload)).patch
+                    patch, patch_ext = orjson.dumps(ops), "patch.json"
+                if len(patch) >= HISTORY_MAX_DELTA_RATIO * len(payload):
+                    patch = None
+                elif patch_ext == "patch.json":
+                    # JSON Patch histories are rebuilt through _serialize, not byte-exactly
+                    rebuilt = self._serialize(jsonpatch.apply_patch(prev_data, ops))
+
+        if patch is not None:
+            filename = f"{next_num:03d}_{stamp}.{patch_ext}"
+            self._atomic_write_bytes(history_dir / filename, patch, write_once=True)
+        else:
+            filename = f"{next_num:03d}_{stamp}.manifest.json"
+            manifest = self._write_chunks(history_dir, payload)
+            self._atomic_write_bytes(history_dir / filename, orjson.dumps(manifest), write_once=True)
 
-        self._atomic_write(history_dir / filename, composition.model_dump(mode='json'))
+        self._write_next_version(history_dir, next_num + 1)
+        self._next_version[composition.id] = next_num + 1
+        self._remember_history_tail(composition.id, next_num, rebuilt)
         logger.info(f"📝 Created history entry: {filename}")
 
+    def _write_chunks(self, history_dir: Path, payload: bytes) -> Dict[str, Any]:
+        """
+        Store a keyframe as byte-exact, content-addressed segments
+
+        The payload is split at its top-level members. Lists/dicts (tracks,
+        clips, mixer_state, chat_history, ...) go to history/objects/<sha256>
+        and are skipped when an identical chunk is already stored; scalar
+        members are kept inline in the manifest. Joining the segments gives
+        back the payload exactly, which is what later deltas were diffed
+        against.
+
+        Returns:
+            Manifest: {"segments": [text | {"field": name, "chunk": sha256}, ...]}
+        """
+        objects_dir = history_dir / "objects"
+        objects_dir.mkdir(exist_ok=True)
+
+        bounds = [0, *(match.start() + 1 for match in KEYFRAME_SEGMENT_RE.finditer(payload)), len(payload)]
+        segments = []
+        for start, end in zip(bounds, bounds[1:]):
+            segment = payload[start:end]
+            key_end = segment.find(b'": ')
+            if key_end < 0 or segment[key_end + 3:key_end + 4] not in (b"[", b"{"):
+                segments.append(segment.decode())
+                continue
+
+            digest = hashlib.sha256(segment).hexdigest()
+            segments.append({"field": segment[3:key_end].decode(), "chunk": digest})
+
+            if ZSTD_AVAILABLE:
+                chunk_file = objects_dir / f"{digest}.json.zst"
+                segment = self._zstd.compress(segment)
+            else:
+                chunk_file = objects_dir / f"{digest}.json"
+            if not chunk_file.exists():
+                self._atomic_write_bytes(chunk_file, segment, write_once=True)
+
+        return {"segments": segments}
+
+    def _read_chunk(self, objects_dir: Path, digest: str) -> Optional[bytes]:
+        """Read a content-addressed chunk (zstd-compressed or plain)"""
+        chunk_file = objects_dir / f"{digest}.json.zst"
+        if chunk_file.exists():
+            if not ZSTD_AVAILABLE:
+                logger.error("❌ zstandard not installed - cannot read compressed history")
+                return None
+            return self._zstd_d.decompress(chunk_file.read_bytes())
+        return (objects_dir / f"{digest}.json").read_bytes()
+
+    def _read_manifest(self, history_dir: Path, manifest_file: Path) -> Optional[bytes]:
+        """Reassemble a keyframe's serialized bytes from its chunk manifest"""
+        manifest = orjson.loads(manifest_file.read_bytes())
+        objects_dir = history_dir / "objects"
+
+        if "segments" in manifest:
+            parts = []
+            for segment in manifest["segments"]:
+                if isinstance(segment, str):
+                    parts.append(segment.encode())
+                    continue
+                chunk = self._read_chunk(objects_dir, segment["chunk"])
+                if chunk is None:
+                    return None
+                parts.append(chunk)
+            return b"".join(parts)
+
+        # Older manifests stored parsed field values and are rebuilt the way
+        # they always were, by re-serializing them
+        data = {}
+        for key in manifest["order"]:
+            if key in manifest["inline"]:
+                data[key] = manifest["inline"][key]
+                continue
+            chunk = self._read_chunk(objects_dir, manifest["chunks"][key])
+            if chunk is None:
+                return None
+            data[key] = orjson.loads(chunk)
+
+        return self._serialize(data)
+
+    def _remember_history_tail(self, composition_id: str, version: int, payload: bytes) -> None:
+        """Keep the bytes of the newest history version for diffing the next one"""
+        with self._hot_cache_lock:
+            self._history_tail[composition_id] = (version, payload)
+            self._history_tail.move_to_end(composition_id)
+            while len(self._history_tail) > HOT_CACHE_SIZE:
+                self._history_tail.popitem(last=False)
+
+    def _recall_history_tail(self, composition_id: str, version: int) -> Optional[bytes]:
+        """Return the cached bytes of a history version if it is the newest one recorded"""
+        with self._hot_cache_lock:
+            cached = self._history_tail.get(composition_id)
+            if cached is None or cached[0] != version:
+                return None
+            self._history_tail.move_to_end(composition_id)
+            return cached[1]
+
+    def _history_entries(self, history_dir: Path) -> Dict[int, Path]:
+        """Map version number -> history file (full snapshot or patch)"""
+        entries = {}
+        with os.scandir(history_dir) as it:
+            for entry in it:
+                match = HISTORY_FILENAME_RE.match(entry.name)
+                if match:
+                    entries[int(match.group(1))] = history_dir / entry.name
+        return entries
+
+    def _read_history_bytes(self, history_dir: Path, version: int) -> Optional[bytes]:
+        """
+        Reconstruct the serialized bytes of a history version
+
+        Walks back to the nearest full snapshot and applies patches forward.
+        Returns None if the chain is broken or patches can't be applied.
+        """
+        entries = self._history_entries(history_dir)
+
+        chain = []
+        current = version
+        while True:
+            entry = entries.get(current)
+            if entry is None:
+                return None
+            if entry.name.endswith(".manifest.json"):
+                data = self._read_manifest(history_dir, entry)
+                if data is None:
+                    return None
+                break
+            if entry.name.endswith(".patch.json"):
+                chain.append(entry)
+                current -= 1
+                continue
+            if entry.suffix == ".json":
+                data = entry.read_bytes()
+                break
+            if entry.suffix == ".zst":
+                if not ZSTD_AVAILABLE:
+                    logger.error("❌ zstandard not installed - cannot read compressed history")
+                    return None
+                data = self._zstd_d.decompress(entry.read_bytes())
+                break
+            chain.append(entry)
+            current -= 1
+
+        for patch_file in reversed(chain):
+            if patch_file.suffix == ".json":
+                if not JSONPATCH_AVAILABLE:
+                    logger.error("❌ jsonpatch not installed - cannot rebuild delta-encoded history")
+                    return None
+                ops = orjson.loads(patch_file.read_bytes())
+                data = self._serialize(jsonpatch.apply_patch(orjson.loads(data), ops))
+            else:
+                if not BSDIFF_AVAILABLE:
+                    logger.error("❌ bsdiff4 not installed - cannot rebuild delta-encoded history")
+                    return None
+                data = bsdiff4.patch(data, patch_file.read_bytes())
+        return data
+
+    def _read_next_version(self, history_dir: Path) -> int:
+        """
+        Read the next history version number from history/.next
+
+        Read once per composition per process and reconciled with the entries on
+        disk: a missing or unreadable counter (e.g. histories written before it
+        existed), or one left behind by a crash between writing an entry and
+        the counter, never hands out a version number that is already taken.
+        """
+        entries = self._history_entries(history_dir) if history_dir.exists() else {}
+        next_free = max(entries, default=-1) + 1
+        try:
+            return max(int((history_dir / ".next").read_text()), next_free)
+        except (FileNotFoundError, ValueError):
+            return next_free
+
+    def _write_next_version(self, history_dir: Path, next_num: int) -> None:
+        """Persist the next history version number to history/.next (atomically)"""
+        self._atomic_write_bytes(history_dir / ".next", str(next_num).encode())
+
+    def _serialize(self, data: Dict[str, Any]) -> bytes:
+        """Serialize a JSON payload the way composition files are stored"""
+        # orjson produces bytes directly, so no intermediate str copy is built
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+
     def _atomic_write(self, path: Path, data: Dict[str, Any]) -> None:
-        """Write JSON file atomically"""
-        temp_path = path.with_suffix('.tmp')
+        """Write JSON file atomically (fsynced before it becomes visible)"""
+        self._atomic_write_bytes(path, self._serialize(data))
+
+    def _atomic_write_bytes(self, path: Path, payload: bytes, write_once: bool = False) -> None:
+        """
+        Write raw bytes atomically (fsynced before they become visible)
+
+        Args:
+            path: Target file
+            payload: Bytes to write
+            write_once: Target is a fresh, never-overwritten file (history entries),
+                so it is created in place with O_EXCL instead of temp file + rename
+        """
+        if self._use_tmpfile:
+            self._atomic_write_linux(path, payload)
+            return
+
+        if write_once:
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                pass  # Unexpected overwrite - take the temp + rename path below
+            else:
+                try:
+                    self._write_all(fd, payload)
+                    self._fsync(fd, path)
+                except Exception:
+                    os.close(fd)
+                    path.unlink(missing_ok=True)
+                    raise
+                os.close(fd)
+                return
+
+        temp_path = path.with_suffix(path.suffix + '.tmp')
         try:
-            with open(temp_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-            shutil.move(str(temp_path), str(path))
+            with open(temp_path, 'wb', buffering=0) as f:
+                self._write_all(f.fileno(), payload)
+                self._fsync(f.fileno(), path)
+            os.replace(temp_path, path)
         except Exception as e:
             if temp_path.exists():
                 temp_path.unlink()
             raise e
 
+    def _remember_payload(self, composition_id: str, mtime_ns: int, payload: bytes) -> None:
+        """Keep the bytes just written to current.json for an immediate reload"""
+        with self._hot_cache_lock:
+            self._hot_cache[composition_id] = (mtime_ns, payload)
+            self._hot_cache.move_to_end(composition_id)
+            while len(self._hot_cache) > HOT_CACHE_SIZE:
+                self._hot_cache.popitem(last=False)
 
+    def _recall_payload(self, composition_id: str, source_file: Path) -> Optional[bytes]:
+        """
+        Return cached current.json bytes if the file hasn't changed since they were saved
+
+        Bytes (not the Composition object) are cached: the saved object is the
+        live in-memory state and keeps mutating, and a deep copy costs more than
+        validating the JSON again.
+        """
+        if source_file.name != "current.json":
+            return None
+        with self._hot_cache_lock:
+            cached = self._hot_cache.get(composition_id)
+            if cached is None:
+                return None
+            if cached[0] != source_file.stat().st_mtime_ns:
+                del self._hot_cache[composition_id]
+                return None
+            self._hot_cache.move_to_end(composition_id)
+            return cached[1]
+
+    def _load_json_mmap(self, path: Path) -> Any:
+        """
+        Parse a JSON file through a read-only memory map
+
+        orjson parses straight from the mapped pages, so the file contents are
+        never copied into an intermediate bytes buffer. Files under
+        MMAP_MIN_BYTES are read normally.
+        """
+        # Small files: a plain read is cheaper than setting up a mapping
+        # (and mmap can't map empty files at all)
+        if path.stat().st_size < MMAP_MIN_BYTES:
+            return orjson.loads(path.read_bytes())
+
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several saves under one durability point
+
+        Inside the block writes skip their per-file fsync; on exit every file
+        written is synced, followed by one fsync per directory touched. Use for
+        bursts of saves, e.g.:
+
+            with composition_service.batch():
+                for composition in iterations:
+                    composition_service.save_composition(composition)
+        """
+        with self._pending_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            deferred = None
+            with self._pending_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    deferred, self._deferred_fsync = self._deferred_fsync, set()
+            if deferred:
+                self._sync_paths(deferred)
+
+    def _fsync(self, fd: int, path: Path) -> None:
+        """fsync a just-written file, or defer it to the end of the current batch()"""
+        if self._batch_depth:
+            with self._pending_lock:
+                if self._batch_depth:
+                    self._deferred_fsync.add(path)
+                    return
+        os.fsync(fd)
+
+    def _sync_paths(self, paths: set) -> None:
+        """fsync each file, then each distinct parent directory once"""
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue  # Deleted again within the batch
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        for directory in {path.parent for path in paths}:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue  # Directory handles can't be opened/fsynced on every platform
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def _write_all(self, fd: int, payload: bytes) -> None:
+        """Write payload to fd in WRITE_CHUNK_SIZE slices without copying it"""
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view[:WRITE_CHUNK_SIZE])
+            view = view[written:]
+
+    def _atomic_write_linux(self, path: Path, payload: bytes) -> None:
+        """
+        Write via an anonymous O_TMPFILE inode (Linux only)
+
+        The data is written and fsynced before the file gets any name, so a
+        crash mid-write never leaves a partial .tmp file behind. A fresh target
+        is published with a single link; since linkat cannot replace an existing
+        file, overwrites link next to the target and rename over it.
+        """
+        fd = os.open(path.parent, os.O_TMPFILE | os.O_WRONLY, 0o644)
+        try:
+            self._write_all(fd, payload)
+            self._fsync(fd, path)
+            try:
+                os.link(f"/proc/self/fd/{fd}", path)
+                return
+            except FileExistsError:
+                pass
+            temp_path = path.with_suffix(path.suffix + '.tmp')
+            temp_path.unlink(missing_ok=True)
+            os.link(f"/proc/self/fd/{fd}", temp_path)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+
+    def _probe_tmpfile_support(self) -> bool:
+        """Check once whether O_TMPFILE + linkat works in the storage directory"""
+        if not hasattr(os, "O_TMPFILE"):
+            return False
+        probe_path = self.storage_dir / ".tmpfile_probe"
+        try:
+            self._atomic_write_linux(probe_path, b"")
+            probe_path.unlink()
+            return True
+        except OSError as e:
+            logger.debug(f"O_TMPFILE writes unavailable, using rename-based writes: {e}")
+            return False
 
-    def load_composition(self, composition_id: str, use_autosave: bool = False) -> Optional[Composition]:
+    def load_composition(
+        self,
+        composition_id: str,
+        use_autosave: bool = False,
+        with_chat: bool = False
+    ) -> Optional[Composition]:
         """
         Load complete composition state
 
         Args:
             composition_id: Composition ID
             use_autosave: Load from autosave instead of current
+            with_chat: Also read the chat_history.json sidecar into chat_history
 
         Returns:
             Complete composition or None if not found
         """
+        # Make sure a queued auto-persist lands before reading from disk
+        self.flush_pending_persists(composition_id)
+
         comp_dir = self._get_composition_dir(composition_id)
 
         if use_autosave:
@@ -171,9 +806,20 @@ class CompositionService:
             return None
 
         try:
-            with open(source_file, 'r') as f:
-                data = json.load(f)
-            return Composition(**data)
+            payload = self._recall_payload(composition_id, source_file)
+            if payload is not None:
+                # Just saved: validate the bytes we wrote instead of re-reading the file
+                composition = Composition.model_validate_json(payload)
+            else:
+                composition = Composition(**self._load_json_mmap(source_file))
+            if with_chat and "chat_history" not in composition.model_fields_set:
+                chat_file = comp_dir / "chat_history.json"
+                chat = self._load_json_mmap(chat_file) if chat_file.exists() else []
+                composition.chat_history = [ChatMessage(**message) for message in chat]
+                self._chat_digests[composition_id] = hashlib.sha256(
+                    self._serialize_chat(composition.chat_history)
+                ).digest()
+            return composition
         except Exception as e:
             logger.error(f"❌ Failed to load composition {composition_id}: {e}")
             return None
@@ -191,20 +837,25 @@ class CompositionService:
         if not history_dir.exists():
             return []
 
+        # Single scandir pass working on DirEntry names - no Path objects are
+        # built and each filename is parsed once
         history = []
-        for entry in sorted(history_dir.glob("*.json")):
-            # Parse filename: 001_20260218_143022.json
-            parts = entry.stem.split('_', 1)
-            version_num = int(parts[0])
-            timestamp_str = parts[1] if len(parts) > 1 else "unknown"
-
-            history.append({
-                "version": version_num,
-                "timestamp": timestamp_str,
-                "filename": entry.name,
-                "path": str(entry)
-            })
-
+        with os.scandir(history_dir) as it:
+            for entry in it:
+                # Parse filename: 001_20260218_143022.json / .json.zst / .patch
+                match = HISTORY_FILENAME_RE.match(entry.name)
+                if not match:
+                    continue
+
+                history.append({
+                    "version": int(match.group(1)),
+                    "timestamp": match.group(2) or "unknown",
+                    "filename": entry.name,
+                    "path": entry.path
+                })
+
+        # Sort on the parsed version number (stays correct past 999)
+        history.sort(key=lambda item: item["version"])
         return history
 
     def load_history_version(self, composition_id: str, version: int) -> Optional[Composition]:
@@ -221,18 +872,21 @@ class CompositionService:
         comp_dir = self._get_composition_dir(composition_id)
         history_dir = comp_dir / "history"
 
-        # Find the file with this version number
-        pattern = f"{version:03d}_*.json"
-        matches = list(history_dir.glob(pattern))
-
-        if not matches:
+        entry = self._history_entries(history_dir).get(version) if history_dir.exists() else None
+        if entry is None:
             logger.warning(f"⚠️ Version {version} not found for composition {composition_id}")
             return None
 
         try:
-            with open(matches[0], 'r') as f:
-                data = json.load(f)
-            return Composition(**data)
+            # Uncompressed full snapshots parse straight from a memory map
+            if entry.suffix == ".json" and not entry.name.endswith((".manifest.json", ".patch.json")):
+                return Composition(**self._load_json_mmap(entry))
+
+            data = self._read_history_bytes(history_dir, version)
+            if data is None:
+                logger.error(f"❌ Failed to rebuild version {version} for composition {composition_id}")
+                return None
+            return Composition.model_validate_json(data)
         except Exception as e:
             logger.error(f"❌ Failed to load version {version}: {e}")
             return None
@@ -242,7 +896,9 @@ class CompositionService:
         Restore a composition to a specific version
 
         This loads the version and saves it as the current state,
-        creating a new history entry.
+        creating a new history entry. The version's chat replaces the
+        current chat; versions recorded before history snapshots carried
+        the chat leave the current chat_history.json untouched.
 
         Args:
             composition_id: Composition ID
@@ -270,6 +926,9 @@ class CompositionService:
         Returns:
             True if successful, False otherwise
         """
+        with self._pending_lock:
+            self._pending_persist.pop(composition_id, None)
+
         comp_dir = self._get_composition_dir(composition_id)
 
         if not comp_dir.exists():
@@ -277,86 +936,171 @@ class CompositionService:
             return False
 
         try:
-            shutil.rmtree(comp_dir)
+            # Renaming is one syscall; the tree itself is removed off the request path
+            trash_dir = self.storage_dir / f"{TRASH_DIR_PREFIX}{composition_id}-{uuid.uuid4().hex[:8]}"
+            os.rename(comp_dir, trash_dir)
+            self._remove_in_background(trash_dir)
+            self._metadata_cache.pop(composition_id, None)
+            self._dir_cache.pop(composition_id, None)
+            self._next_version.pop(composition_id, None)
+            self._chat_digests.pop(composition_id, None)
+            with self._hot_cache_lock:
+                self._hot_cache.pop(composition_id, None)
+                self._history_tail.pop(composition_id, None)
             logger.info(f"🗑️ Deleted composition {composition_id}")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to delete composition {composition_id}: {e}")
             return False
 
+    def _remove_in_background(self, path: Path) -> None:
+        """Delete a directory tree on a daemon thread"""
+        threading.Thread(
+            target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=True
+        ).start()
+
     def list_compositions(self) -> List[CompositionMetadata]:
         """
         List all compositions
 
+        Each composition directory is read independently, so the reads run on a
+        small thread pool to overlap file I/O across compositions.
+
         Returns:
             List of CompositionMetadata objects (lightweight info for browsing)
         """
-        compositions = []
+        self.flush_pending_persists()
 
-        for comp_dir in self.storage_dir.iterdir():
-            if not comp_dir.is_dir():
-                continue
+        comp_dirs = [
+            d for d in self.storage_dir.iterdir()
+            if d.is_dir() and not d.name.startswith(TRASH_DIR_PREFIX)
+        ]
+        if not comp_dirs:
+            return []
 
-            current_file = comp_dir / "current.json"
-            if not current_file.exists():
-                continue
+        with ThreadPoolExecutor(max_workers=min(32, len(comp_dirs))) as executor:
+            results = list(executor.map(self._read_metadata, comp_dirs))
 
-            try:
-                with open(current_file, 'r') as f:
-                    data = json.load(f)
+        compositions = [metadata for metadata in results if metadata is not None]
 
-                # Extract sequence data for stats
-                sequence_data = data.get("sequence", {})
-                tracks = sequence_data.get("tracks", [])
+        # Sort by updated_at (most recent first)
+        return sorted(compositions, key=lambda x: x.updated_at, reverse=True)
 
-                # Count total clips across all tracks
-                clip_count = sum(len(track.get("clips", [])) for track in tracks)
+    def _read_metadata(self, comp_dir: Path) -> Optional[CompositionMetadata]:
+        """
+        Read listing metadata for a single composition directory
 
-                # Calculate duration (max end position of all clips)
-                duration_beats = 0.0
-                for track in tracks:
-                    for clip in track.get("clips", []):
-                        clip_end = clip.get("start_beat", 0) + clip.get("duration_beats", 0)
-                        duration_beats = max(duration_beats, clip_end)
+        Returns:
+            CompositionMetadata, or None if the directory holds no readable composition
+        """
+        current_file = comp_dir / "current.json"
+        if not current_file.exists():
+            return None
 
-                # Check for autosave
-                autosave_file = comp_dir / "autosave.json"
-                has_autosave = autosave_file.exists()
-
-                # Get file size
-                file_size_bytes = current_file.stat().st_size if current_file.exists() else None
-
-                # Parse timestamps
-                created_at = data.get("created_at")
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                elif not isinstance(created_at, datetime):
-                    created_at = datetime.now()
-
-                updated_at = data.get("metadata", {}).get("updated_at")
-                if isinstance(updated_at, str):
-                    updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                elif not isinstance(updated_at, datetime):
-                    updated_at = created_at
-
-                compositions.append(CompositionMetadata(
-                    id=comp_dir.name,
-                    name=data.get("name", "Untitled"),
-                    tempo=sequence_data.get("tempo", 120.0),
-                    time_signature=sequence_data.get("time_signature", "4/4"),
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    track_count=len(tracks),
-                    clip_count=clip_count,
-                    duration_beats=duration_beats,
-                    file_size_bytes=file_size_bytes,
-                    has_autosave=has_autosave
-                ))
-            except Exception as e:
-                logger.error(f"❌ Failed to read composition {comp_dir.name}: {e}")
+        try:
+            st = current_file.stat()
+
+            # Check for autosave
+            autosave_file = comp_dir / "autosave.json"
+            has_autosave = autosave_file.exists()
+
+            # Reuse cached metadata while current.json is unchanged
+            cached = self._metadata_cache.get(comp_dir.name)
+            if cached and cached[0] == st.st_mtime_ns and cached[1].has_autosave == has_autosave:
+                return cached[1]
+
+            metadata_file = comp_dir / "metadata.json"
+            if metadata_file.exists():
+                # Fast path: tiny sidecar written at save time
+                fields = orjson.loads(metadata_file.read_bytes())
+            else:
+                # Migration path: compositions saved before the sidecar existed
+                fields = self._read_metadata_from_current(current_file)
+
+            metadata = self._construct_metadata(comp_dir.name, st, has_autosave, fields)
+            self._metadata_cache[comp_dir.name] = (st.st_mtime_ns, metadata)
+            return metadata
+        except Exception as e:
+            logger.error(f"❌ Failed to read composition {comp_dir.name}: {e}")
+            return None
 
-        # Sort by updated_at (most recent first)
-        return sorted(compositions, key=lambda x: x.updated_at, reverse=True)
+    def _construct_metadata(
+        self,
+        composition_id: str,
+        st: os.stat_result,
+        has_autosave: bool,
+        fields: Dict[str, Any]
+    ) -> CompositionMetadata:
+        """
+        Build CompositionMetadata without Pydantic validation
+
+        The fields come from files this service wrote from validated
+        Compositions, so only the type coercions validation would have done
+        are applied here.
+        """
+        created_at = fields["created_at"]
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        updated_at = fields["updated_at"]
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+
+        return CompositionMetadata.model_construct(
+            id=composition_id,
+            name=fields["name"],
+            tempo=float(fields["tempo"]),
+            time_signature=fields["time_signature"],
+            created_at=created_at,
+            updated_at=updated_at,
+            track_count=int(fields["track_count"]),
+            clip_count=int(fields["clip_count"]),
+            duration_beats=float(fields["duration_beats"]),
+            file_size_bytes=st.st_size,
+            has_autosave=has_autosave,
+        )
+
+    def _read_metadata_from_current(self, current_file: Path) -> Dict[str, Any]:
+        """
+        Derive listing metadata by parsing a full current.json
+
+        Only used for compositions that have no metadata.json sidecar yet.
+        """
+        data = self._load_json_mmap(current_file)
+
+        tracks = data.get("tracks", [])
+        clips = data.get("clips", [])
+
+        # Single pass over clips: count them and find the furthest clip end
+        clip_count = len(clips)
+        duration_beats = 0.0
+        for clip in clips:
+            clip_end = clip.get("start_time", 0) + clip.get("duration", 0)
+            if clip_end > duration_beats:
+                duration_beats = clip_end
+
+        # Parse timestamps
+        created_at = data.get("created_at")
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        elif not isinstance(created_at, datetime):
+            created_at = datetime.now()
+
+        updated_at = data.get("updated_at")
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+        elif not isinstance(updated_at, datetime):
+            updated_at = created_at
+
+        return {
+            "name": data.get("name", "Untitled"),
+            "tempo": data.get("tempo", 120.0),
+            "time_signature": data.get("time_signature", "4/4"),
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "track_count": len(tracks),
+            "clip_count": clip_count,
+            "duration_beats": duration_beats,
+        }
 
     # ========================================================================
     # SNAPSHOT BUILDING HELPERS
@@ -392,19 +1136,17 @@ class CompositionService:
         # Update composition with current global state
         composition.mixer_state = mixer_service.state
 
-        # Get all track effects
+        # Get all track effects and sample assignments in one pass over the tracks
         track_effects = []
+        sample_assignments = {}
         for track in composition.tracks:
             effect_chain = effects_service.get_track_effect_chain(track.id)
             if effect_chain and effect_chain.effects:  # Only include if there are effects
                 track_effects.append(effect_chain)
-        composition.track_effects = track_effects
-
-        # Get sample assignments (from audio tracks with a sample file)
-        sample_assignments = {}
-        for track in composition.tracks:
+            # Sample assignments come from audio tracks with a sample file
             if track.type == "audio" and getattr(track, 'sample_file_path', None):
                 sample_assignments[track.id] = track.sample_file_path
+        composition.track_effects = track_effects
         composition.sample_assignments = sample_assignments
 
         # Update timestamp
@@ -426,6 +1168,10 @@ class CompositionService:
         This is called automatically after every mutation (create/update/delete track/clip/etc).
         It updates current.json but does NOT create history entries.
 
+        Writes are debounced: the captured composition is queued and a background
+        timer flushes it after AUTO_PERSIST_DEBOUNCE_SECONDS, so a burst of
+        mutations costs one durable write instead of one per mutation.
+
         UNDO/REDO INTEGRATION:
         - If push_undo=True, this method will push the CURRENT state to undo stack BEFORE persisting
         - This is called AFTER the mutation, so it captures the NEW state
@@ -460,20 +1206,52 @@ class CompositionService:
                 logger.error(f"❌ Failed to capture composition {composition_id} for auto-persist")
                 return False
 
-            # Save to current.json (NO history entry)
-            self.save_composition(
-                composition=composition,
-                create_history=False,  # Don't spam history with every mutation
-                is_autosave=False      # This is sync, not autosave
-            )
-
-            logger.debug(f"🔄 Auto-persisted composition {composition_id}")
+            # Queue for the next flush to current.json (NO history entry)
+            with self._pending_lock:
+                self._pending_persist[composition_id] = composition
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        AUTO_PERSIST_DEBOUNCE_SECONDS, self.flush_pending_persists
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+            logger.debug(f"🔄 Queued auto-persist for composition {composition_id}")
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to auto-persist composition {composition_id}: {e}")
             return False
 
+    def flush_pending_persists(self, composition_id: Optional[str] = None) -> None:
+        """
+        Write queued auto-persist compositions to disk
+
+        Args:
+            composition_id: Only flush this composition (default: flush all)
+        """
+        with self._pending_lock:
+            if composition_id is None:
+                pending = list(self._pending_persist.values())
+                self._pending_persist.clear()
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            else:
+                composition = self._pending_persist.pop(composition_id, None)
+                pending = [composition] if composition else []
+
+        for composition in pending:
+            try:
+                self.save_composition(
+                    composition=composition,
+                    create_history=False,  # Don't spam history with every mutation
+                    is_autosave=False      # This is sync, not autosave
+                )
+                logger.debug(f"🔄 Auto-persisted composition {composition.id}")
+            except Exception as e:
+                logger.error(f"❌ Failed to auto-persist composition {composition.id}: {e}")
+
     async def restore_composition_to_services(
         self,
         composition: Composition,
@@ -507,6 +1285,7 @@ class CompositionService:
 
             # Set as current composition (only if requested)
             if set_as_current:
+                tracks_by_id = {t.id: t for t in composition.tracks}
                 composition_state_service.current_composition_id = composition.id
                 # Restore mixer state (only for current composition)
                 mixer_service.state = composition.mixer_state
@@ -519,8 +1298,8 @@ class CompositionService:
                 # Restore sample assignments
                 for track_id, sample_path in composition.sample_assignments.items():
                     # Find track in composition
-                    track = next((t for t in composition.tracks if t.id == track_id), None)
-                    if track and hasattr(track, 'sample_file_path'):
+                    track = tracks_by_id.get(track_id)
+                    if track:
                         track.sample_file_path = sample_path
 
                 # CRITICAL FIX: Recreate mixer channels for all tracks
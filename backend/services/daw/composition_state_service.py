@@ -22,7 +22,7 @@ VALIDATION:
 """
 import logging
 import uuid
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from collections import deque
 
@@ -331,16 +331,35 @@ class CompositionStateService:
 
         return None
 
-    def delete_track(self, track_id: str) -> bool:
-        """Delete track from its composition and clean up clip launcher references"""
-        for composition in self.compositions.values():
+    def delete_track(self, track_id: str, composition_id: Optional[str] = None) -> bool:
+        """
+        Delete track from its composition and clean up clip launcher references
+
+        Args:
+            track_id: ID of track to delete
+            composition_id: Composition containing the track; when given only that
+                composition is searched instead of all of them
+        """
+        if composition_id is not None:
+            composition = self.compositions.get(composition_id)
+            compositions = [composition] if composition else []
+        else:
+            compositions = self.compositions.values()
+
+        for composition in compositions:
             for i, track in enumerate(composition.tracks):
                 if track.id == track_id:
-                    # Get clip IDs that will be deleted
-                    deleted_clip_ids = [c.id for c in composition.clips if c.track_id == track_id]
-
-                    # Delete all clips on this track
-                    composition.clips = [c for c in composition.clips if c.track_id != track_id]
+                    # Delete all clips on this track in one pass, in place, collecting
+                    # their IDs (a set, for the clip-slot cleanup below)
+                    deleted_clip_ids = set()
+                    kept_clips = []
+                    for clip in composition.clips:
+                        if clip.track_id == track_id:
+                            deleted_clip_ids.add(clip.id)
+                        else:
+                            kept_clips.append(clip)
+                    if deleted_clip_ids:
+                        composition.clips[:] = kept_clips
 
                     # CRITICAL: Clean up clip launcher slot references for deleted clips
                     if composition.clip_slots and deleted_clip_ids:
@@ -392,24 +411,28 @@ class CompositionStateService:
 
         return False
 
-    def update_sample_references(self, sample_id: str, new_name: str) -> int:
-        """Update sample references across all tracks"""
-        count = 0
+    def _tracks_using_sample(self, sample_id: str) -> Iterator[Tuple[Composition, Track]]:
+        """Yield (composition, track) for every track that references a sample"""
         for composition in self.compositions.values():
             for track in composition.tracks:
                 if track.sample_id == sample_id:
-                    track.sample_name = new_name
-                    count += 1
+                    yield composition, track
+
+    def update_sample_references(self, sample_id: str, new_name: str) -> int:
+        """Update sample references across all tracks"""
+        count = 0
+        for _, track in self._tracks_using_sample(sample_id):
+            track.sample_name = new_name
+            count += 1
         logger.info(f"📝 Updated {count} sample references for sample {sample_id}")
         return count
 
     def check_sample_in_use(self, sample_id: str) -> Tuple[bool, List[str]]:
         """Check if a sample is in use by any tracks"""
-        track_names = []
-        for composition in self.compositions.values():
-            for track in composition.tracks:
-                if track.sample_id == sample_id:
-                    track_names.append(f"{track.name} (in {composition.name})")
+        track_names = [
+            f"{track.name} (in {composition.name})"
+            for composition, track in self._tracks_using_sample(sample_id)
+        ]
         return len(track_names) > 0, track_names
 
     # ========================================================================
@@ -121,15 +121,18 @@ class MixerTrackChannelsService:
                 logger.warning(f"⚠️ No mixer channel found for track {track_id}")
                 return
 
-            # Send parameter updates
+            # Send all parameter updates as one /n_set (it takes any number of control/value pairs)
+            controls = []
             if volume is not None:
-                self.engine_manager.send_message("/n_set", node_id, "volume", volume)
+                controls += ["volume", volume]
             if pan is not None:
-                self.engine_manager.send_message("/n_set", node_id, "pan", pan)
+                controls += ["pan", pan]
             if mute is not None:
-                self.engine_manager.send_message("/n_set", node_id, "mute", 1 if mute else 0)
+                controls += ["mute", 1 if mute else 0]
             if solo is not None:
-                self.engine_manager.send_message("/n_set", node_id, "solo", 1 if solo else 0)
+                controls += ["solo", 1 if solo else 0]
+            if controls:
+                self.engine_manager.send_message("/n_set", node_id, *controls)
 
             logger.debug(f"Updated mixer channel {track_id} (node {node_id})")
 
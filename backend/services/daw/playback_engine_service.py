@@ -11,8 +11,11 @@ ARCHITECTURE:
 import logging
 import uuid
 import asyncio
+import math
 import time
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 from backend.models.composition import Composition
@@ -26,6 +29,37 @@ from backend.services.daw.mixer_track_channels_service import MixerTrackChannels
 
 logger = logging.getLogger(__name__)
 
+# backend/services/daw/ -> project root; samples live in project_root/data/samples
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+SAMPLES_DIR = PROJECT_ROOT / "data" / "samples"
+SAMPLE_EXTENSIONS = ('.webm', '.wav', '.mp3', '.ogg', '.flac')
+
+# Equal-temperament frequency (A4 = 440 Hz) for every MIDI note number 0-127
+MIDI_NOTE_FREQUENCIES = tuple(440.0 * (2.0 ** ((note - 69) / 12.0)) for note in range(128))
+
+# Timeline MIDI notes are handed to scsynth this long before they start, so a
+# stop/seek only has to free the few notes already sent instead of clearing
+# the server's whole scheduler
+MIDI_SCHEDULE_LOOKAHEAD_SECONDS = 0.1
+
+# With no transport clients to update, the playback loop sleeps until the next
+# clip boundary / metronome beat / loop end, but wakes at least this often so
+# seeks and clip edits are still picked up promptly
+PLAYBACK_IDLE_MAX_WAIT_SECONDS = 0.1
+
+# timeline_active_synths marker for MIDI clips: their notes are separate nodes,
+# so the clip itself owns no synth and must not burn a node ID or be /n_free'd
+MIDI_CLIP_SENTINEL = -1
+
+
+@lru_cache(maxsize=32)
+def _parse_time_signature(time_signature: str) -> Tuple[int, int]:
+    """Parse a time signature like "4/4" into (numerator, denominator), cached per string"""
+    parts = time_signature.split("/")
+    num = int(parts[0]) if len(parts) > 0 else 4
+    den = int(parts[1]) if len(parts) > 1 else 4
+    return num, den
+
 
 class PlaybackEngineService:
     """
@@ -82,6 +116,11 @@ class PlaybackEngineService:
         self.timeline_active_synths: Dict[str, int] = {}  # clip_id -> node_id (for timeline playback)
         self.timeline_active_midi_notes: Dict[int, ActiveMIDINote] = {}  # node_id -> note data
         self.timeline_midi_note_tasks: Set[asyncio.Task] = set()  # MIDI note tasks for timeline
+        # node_id -> wall-clock start time for scheduled notes, the ones already sent
+        # to scsynth, and the send/UI timers that track them (one per distinct time)
+        self.timeline_scheduled_notes: Dict[int, float] = {}
+        self.timeline_sent_notes: Set[int] = set()
+        self.timeline_note_timers: Set[asyncio.TimerHandle] = set()
 
         # CLIP LAUNCHER STATE (performance mode)
         self.launcher_active_synths: Dict[str, int] = {}  # clip_id -> node_id (for clip launcher)
@@ -120,7 +159,7 @@ class PlaybackEngineService:
             node_id = self.engine_manager.allocate_node_id()
 
             # Convert MIDI note to frequency (may be overridden by params)
-            freq = 440.0 * (2.0 ** ((note - 69) / 12.0))
+            freq = MIDI_NOTE_FREQUENCIES[note]
             amp = velocity / 127.0
 
             # Build OSC args: base params first, then kit-specific overrides
@@ -142,23 +181,20 @@ class PlaybackEngineService:
 
             logger.debug(f"🎹 Preview note {note} (freq={freq:.1f}Hz, vel={velocity})")
 
-            # Schedule release after duration
-            async def release_after_duration():
-                await asyncio.sleep(duration)
-                try:
-                    # Send gate=0 to trigger release envelope
-                    self.engine_manager.send_message("/n_set", node_id, "gate", 0)
-                    logger.debug(f"🔇 Released preview note {note} after {duration}s")
-                except Exception as e:
-                    logger.warning(f"Failed to release preview note {node_id}: {e}")
-
-            # Start release task (fire and forget)
-            asyncio.create_task(release_after_duration())
+            # Release (gate=0) from an event-loop timer rather than a task per note
+            asyncio.get_running_loop().call_later(duration, self._release_preview_note, node_id)
 
         except Exception as e:
             logger.error(f"❌ Failed to preview note: {e}")
             raise
 
+    def _release_preview_note(self, node_id: int) -> None:
+        """Gate off a preview note once its duration has elapsed"""
+        try:
+            self.engine_manager.send_message("/n_set", node_id, "gate", 0)
+        except Exception as e:
+            logger.error(f"❌ Failed to release preview note {node_id}: {e}")
+
     # ========================================================================
     # PREVIEW KIT DEMO (for sound browser)
     # ========================================================================
@@ -274,9 +310,7 @@ class PlaybackEngineService:
         first /s_new arrives.  Without this, the first trigger of a sample that has
         never been loaded in the current session would race against an unready buffer.
         """
-        from pathlib import Path
-
-        samples_dir = Path(__file__).parent.parent.parent.parent / "data" / "samples"
+        samples_dir = SAMPLES_DIR
         loaded: set = set()
 
         for clip in composition.clips:
@@ -326,7 +360,7 @@ class PlaybackEngineService:
                 else:
                     audio_path = Path(audio_file_path)
                     if not audio_path.is_absolute():
-                        audio_path = Path(__file__).parent.parent.parent.parent / audio_path
+                        audio_path = PROJECT_ROOT / audio_path
                 if audio_path and audio_path.exists():
                     try:
                         await self.buffer_manager.load_sample(cache_key, str(audio_path))
@@ -354,29 +388,52 @@ class PlaybackEngineService:
 
         # Playback loop constants
         update_interval = 0.02  # 50 Hz update rate (20ms)
+        broadcast_every = 2  # Position-only transport updates every 2nd tick (25 Hz)
+        heartbeat_every = 250  # Debug heartbeat every 250 ticks (5 s)
+        last_broadcast_state = None
+        loop_wraps = 0
+        # Active-notes payload, rebuilt only when the set of sounding nodes changes
+        active_notes_key: Tuple[int, ...] = ()
+        active_notes_list: List[dict] = []
 
-        last_time = time.time()
         loop_count = 0
 
+        # The playhead is derived from an anchor (monotonic time, beat position,
+        # tempo) instead of accumulating per-tick deltas, and ticks are scheduled
+        # against absolute deadlines - event-loop jitter never turns into drift
+        event_loop = asyncio.get_running_loop()
+        tick_time = anchor_time = next_tick = event_loop.time()
+        position = anchor_position = self.playhead_position
+        anchor_tempo = self.tempo
+        # First beat still to click: a beat is clicked when the playhead crosses it
+        next_metronome_beat = math.ceil(position)
+
         try:
             logger.info("🔄 Entering playback loop...")
             while self.is_playing:
                 loop_count += 1
 
-                # Log every 50 iterations (once per second at 50Hz)
-                if loop_count % 50 == 0:
-                    logger.info(f"🔄 Playback loop running: position={self.playhead_position:.2f} beats, is_playing={self.is_playing}")
-
-                current_time = time.time()
-                delta_time = current_time - last_time
-                last_time = current_time
+                # Debug heartbeat (the f-string is only built when DEBUG is enabled)
+                if loop_count % heartbeat_every == 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔄 Playback loop running: position={self.playhead_position:.2f} beats, is_playing={self.is_playing}")
+
+                now = event_loop.time()
+                if self.playhead_position != position:
+                    # Seek while playing: restart from the new position
+                    anchor_time, anchor_position = now, self.playhead_position
+                    next_metronome_beat = math.ceil(anchor_position)
+                elif self.tempo != anchor_tempo:
+                    # Tempo change: keep the position reached at the last tick
+                    anchor_time, anchor_position = tick_time, position
+                anchor_tempo = self.tempo
+                tick_time = now
 
                 # Recalculate beat duration on every iteration to respond to tempo changes in real-time
                 beat_duration = 60.0 / self.tempo  # seconds per beat
 
                 # Advance playhead
-                delta_beats = (delta_time / beat_duration)
-                self.playhead_position += delta_beats
+                position = anchor_position + (now - anchor_time) / beat_duration
+                self.playhead_position = position
 
                 # End-of-composition detection (only when loop is disabled)
                 if not composition.loop_enabled and composition.clips:
@@ -390,23 +447,20 @@ class PlaybackEngineService:
                         composition.current_position = 0.0
 
                         # Free all active synths
-                        if self.engine_manager:
-                            for node_id in self.timeline_active_synths.values():
-                                self.engine_manager.send_message("/n_free", node_id)
+                        self._free_nodes(self.timeline_active_synths.values())
                         self.timeline_active_synths.clear()
                         for task in list(self.timeline_midi_note_tasks):
                             task.cancel()
                         if self.timeline_midi_note_tasks:
                             await asyncio.gather(*self.timeline_midi_note_tasks, return_exceptions=True)
                         self.timeline_midi_note_tasks.clear()
-                        if self.engine_manager:
-                            for node_id in self.timeline_active_midi_notes.keys():
-                                self.engine_manager.send_message("/n_free", node_id)
+                        self._cancel_scheduled_midi_notes()
+                        self._free_nodes(self.timeline_active_midi_notes.keys())
                         self.timeline_active_midi_notes.clear()
 
                         # Broadcast stopped state so the frontend updates immediately
                         if self.websocket_manager:
-                            time_sig_parts = composition.time_signature.split("/")
+                            time_sig_num, time_sig_den = _parse_time_signature(composition.time_signature)
                             await self.websocket_manager.broadcast_transport({
                                 "type": "transport",
                                 "is_playing": False,
@@ -414,8 +468,8 @@ class PlaybackEngineService:
                                 "position_beats": 0.0,
                                 "position_seconds": 0.0,
                                 "tempo": self.tempo,
-                                "time_signature_num": int(time_sig_parts[0]) if time_sig_parts else 4,
-                                "time_signature_den": int(time_sig_parts[1]) if len(time_sig_parts) > 1 else 4,
+                                "time_signature_num": time_sig_num,
+                                "time_signature_den": time_sig_den,
                                 "loop_enabled": composition.loop_enabled,
                                 "loop_start": composition.loop_start,
                                 "loop_end": composition.loop_end,
@@ -432,27 +486,33 @@ class PlaybackEngineService:
 
                     # Free all active synths before looping back (TIMELINE ONLY)
                     if self.engine_manager:
-                        for clip_id, node_id in list(self.timeline_active_synths.items()):
-                            self.engine_manager.send_message("/n_free", node_id)
+                        self._free_nodes(self.timeline_active_synths.values())
                         self.timeline_active_synths.clear()
 
                     # FIX: Cancel all MIDI note tasks before looping (TIMELINE ONLY)
-                    logger.info(f"🔁 Cancelling {len(self.timeline_midi_note_tasks)} MIDI note tasks for loop")
+                    logger.debug(f"🔁 Cancelling {len(self.timeline_midi_note_tasks)} MIDI note tasks for loop")
                     for task in list(self.timeline_midi_note_tasks):
                         task.cancel()
                     # Wait for all tasks to be cancelled
                     if self.timeline_midi_note_tasks:
                         await asyncio.gather(*self.timeline_midi_note_tasks, return_exceptions=True)
                     self.timeline_midi_note_tasks.clear()
+                    self._cancel_scheduled_midi_notes()
 
                     # FIX: Free all active MIDI notes (TIMELINE ONLY)
-                    if self.engine_manager:
-                        for node_id in list(self.timeline_active_midi_notes.keys()):
-                            self.engine_manager.send_message("/n_free", node_id)
+                    self._free_nodes(self.timeline_active_midi_notes.keys())
                     self.timeline_active_midi_notes.clear()
 
-                    # Jump back to loop start
-                    self.playhead_position = composition.loop_start
+                    # Jump back to loop start, carrying the overshoot past loop_end so
+                    # every pass through the loop lasts exactly as long
+                    overshoot = position - composition.loop_end
+                    if not overshoot < composition.loop_end - composition.loop_start:
+                        overshoot = 0.0
+                    anchor_time, anchor_position = tick_time, composition.loop_start + overshoot
+                    position = anchor_position
+                    self.playhead_position = position
+                    next_metronome_beat = math.ceil(composition.loop_start)
+                    loop_wraps += 1
 
                 # Update composition position
                 composition.current_position = self.playhead_position
@@ -461,13 +521,14 @@ class PlaybackEngineService:
                 await self._check_and_trigger_clips(composition, self.playhead_position)
 
                 # Trigger metronome on every beat if enabled
-                if self.metronome_enabled and self.engine_manager:
-                    current_beat = int(self.playhead_position)
-                    if current_beat != self.last_metronome_beat:
-                        self.last_metronome_beat = current_beat
+                if position >= next_metronome_beat:
+                    # floor() rather than int() so negative positions round down too;
+                    # if a tick lands several beats late, only the current beat clicks
+                    current_beat = math.floor(position)
+                    next_metronome_beat = current_beat + 1
+                    if self.metronome_enabled and self.engine_manager:
                         # Parse time signature to determine accent (downbeat)
-                        time_sig_parts = composition.time_signature.split("/")
-                        time_sig_num = int(time_sig_parts[0]) if len(time_sig_parts) > 0 else 4
+                        time_sig_num, _ = _parse_time_signature(composition.time_signature)
                         # Accent on first beat of measure
                         beat_in_measure = current_beat % time_sig_num
                         accent = 1 if beat_in_measure == 0 else 0
@@ -484,25 +545,38 @@ class PlaybackEngineService:
                             "accent", accent
                         )
 
-                # Send position update to frontend via WebSocket
-                if self.websocket_manager:
+                # Send position update to frontend via WebSocket (skip building
+                # the payload entirely when nobody is listening). Position-only
+                # updates are throttled; any state change is sent on this tick.
+                active_notes_now = tuple(self.timeline_active_midi_notes)
+                broadcast_state = (
+                    self.is_playing, self.tempo, self.metronome_enabled, loop_wraps,
+                    composition.loop_enabled, composition.loop_start, composition.loop_end,
+                    active_notes_now,
+                    tuple(self.launcher_active_synths), tuple(self.triggered_clips),
+                )
+                broadcast_due = loop_count % broadcast_every == 0 or broadcast_state != last_broadcast_state
+                if broadcast_due and self.websocket_manager and self.websocket_manager.transport_clients:
+                    last_broadcast_state = broadcast_state
                     # Parse time signature (e.g., "4/4" -> num=4, den=4)
-                    time_sig_parts = composition.time_signature.split("/")
-                    time_sig_num = int(time_sig_parts[0]) if len(time_sig_parts) > 0 else 4
-                    time_sig_den = int(time_sig_parts[1]) if len(time_sig_parts) > 1 else 4
-
-                    # Build active notes list for visual feedback (TIMELINE ONLY)
-                    active_notes_list = [
-                        {"clip_id": note_data["clip_id"], "note": note_data["note"], "start_time": note_data["start_time"]}
-                        for note_data in self.timeline_active_midi_notes.values()
-                    ]
+                    time_sig_num, time_sig_den = _parse_time_signature(composition.time_signature)
+
+                    # Build active notes list for visual feedback (TIMELINE ONLY). Node ids
+                    # are never reused, so the same ids mean the same notes and the
+                    # previous list can be sent again as is.
+                    if active_notes_now != active_notes_key:
+                        active_notes_key = active_notes_now
+                        active_notes_list = [
+                            {"clip_id": note_data.clip_id, "note": note_data.note, "start_time": note_data.start_time}
+                            for note_data in self.timeline_active_midi_notes.values()
+                        ]
 
                     transport_data = {
                         "type": "transport",
                         "is_playing": self.is_playing,
                         "is_paused": self.is_paused,
                         "position_beats": self.playhead_position,
-                        "position_seconds": self.playhead_position * (60.0 / self.tempo),
+                        "position_seconds": self.playhead_position * beat_duration,
                         "tempo": self.tempo,
                         "time_signature_num": time_sig_num,
                         "time_signature_den": time_sig_den,
@@ -514,13 +588,31 @@ class PlaybackEngineService:
                         # Clip launcher state (for real-time UI updates) - SEPARATE from timeline
                         "playing_clips": list(self.launcher_active_synths.keys()),
                         "triggered_clips": list(self.triggered_clips.keys()),
+                        # OSC packets lost on the way to scsynth (dropped or failed sends)
+                        "osc_send_failures": (
+                            self.engine_manager.dropped_send_count + self.engine_manager.send_error_count
+                            if self.engine_manager else 0
+                        ),
                     }
-                    if loop_count == 1:
-                        logger.info(f"📡 Broadcasting first transport update: {transport_data}")
+                    if loop_count == 1 and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"📡 Broadcasting first transport update: {transport_data}")
                     await self.websocket_manager.broadcast_transport(transport_data)
 
-                # Sleep until next update
-                await asyncio.sleep(update_interval)
+                # Sleep until the next absolute tick; if we fell more than a tick
+                # behind, resynchronise instead of firing a burst of catch-up ticks.
+                # Without listeners there is nothing to do between events, so the
+                # tick is stretched up to the next clip/beat/loop boundary.
+                if self.websocket_manager and self.websocket_manager.transport_clients:
+                    next_tick += update_interval
+                else:
+                    next_tick = tick_time + max(update_interval, min(
+                        PLAYBACK_IDLE_MAX_WAIT_SECONDS,
+                        self._seconds_to_next_event(composition, self.playhead_position, beat_duration)
+                    ))
+                delay = next_tick - event_loop.time()
+                if delay < 0:
+                    next_tick = event_loop.time()
+                await asyncio.sleep(max(0.0, delay))
 
             logger.info(f"🛑 Playback loop exited: is_playing={self.is_playing}, loop_count={loop_count}")
 
@@ -531,6 +623,24 @@ class PlaybackEngineService:
             logger.error(f"❌ Error in playback loop: {e}", exc_info=True)
             self.is_playing = False
 
+    def _seconds_to_next_event(self, composition: Composition, position: float, beat_duration: float) -> float:
+        """
+        Time until the playback loop next has work: a clip starting or ending,
+        a metronome beat, the loop end or the end of the composition (TIMELINE PLAYBACK)
+        """
+        next_beat = float("inf")
+        for clip in composition.clips:
+            clip_start = clip.start_time
+            if clip_start > position:
+                next_beat = min(next_beat, clip_start)
+            elif clip_start + clip.duration > position:
+                next_beat = min(next_beat, clip_start + clip.duration)
+        if self.metronome_enabled:
+            next_beat = min(next_beat, math.floor(position) + 1)
+        if composition.loop_enabled:
+            next_beat = min(next_beat, composition.loop_end)
+        return max(0.0, (next_beat - position) * beat_duration)
+
     async def _check_and_trigger_clips(self, composition: Composition, position: float) -> None:
         """
         Check if any clips should be triggered at the current position (TIMELINE PLAYBACK)
@@ -539,11 +649,13 @@ class PlaybackEngineService:
             composition: Composition being played
             position: Current playhead position in beats
         """
+        # Index clips once per tick: O(clips) instead of a linear search per active synth
+        clips_by_id = {c.id: c for c in composition.clips} if self.timeline_active_synths else {}
+
         # First, stop any clips that are playing but shouldn't be (playhead moved outside their range)
         clips_to_stop = []
-        for clip_id, node_id in list(self.timeline_active_synths.items()):
-            # Find the clip
-            clip = next((c for c in composition.clips if c.id == clip_id), None)
+        for clip_id, node_id in self.timeline_active_synths.items():
+            clip = clips_by_id.get(clip_id)
             if clip:
                 clip_start = clip.start_time
                 clip_end = clip.start_time + clip.duration
@@ -554,19 +666,30 @@ class PlaybackEngineService:
 
         # Stop clips that are out of range
         for clip_id, node_id in clips_to_stop:
-            logger.info(f"🛑 Stopping clip {clip_id} (node {node_id}) - playhead outside range")
-            if self.engine_manager:
-                self.engine_manager.send_message("/n_free", node_id)
+            logger.debug(f"🛑 Stopping clip {clip_id} (node {node_id}) - playhead outside range")
             del self.timeline_active_synths[clip_id]
+        if clips_to_stop:
+            self._free_nodes(node_id for _, node_id in clips_to_stop)
+
+        # Now find clips that should start playing: under the playhead, not muted
+        # and not already playing. On most ticks this is empty and the track
+        # index is never built.
+        active = self.timeline_active_synths
+        due = [
+            clip for clip in composition.clips
+            if clip.start_time <= position < clip.start_time + clip.duration
+            and not clip.is_muted and clip.id not in active
+        ]
+        if not due:
+            return
 
-        # Now check for clips that should start playing
-        for clip in composition.clips:
-            # Skip muted clips
-            if clip.is_muted:
-                continue
+        tracks_by_id = {t.id: t for t in composition.tracks}
+        for clip in due:
+            clip_start = clip.start_time
+            clip_end = clip.start_time + clip.duration
 
             # Find the track for this clip
-            track = next((t for t in composition.tracks if t.id == clip.track_id), None)
+            track = tracks_by_id.get(clip.track_id)
             if not track:
                 logger.warning(f"⚠️ Clip {clip.id} has no matching track (track_id: {clip.track_id})")
                 continue
@@ -575,18 +698,120 @@ class PlaybackEngineService:
             if track.is_muted:
                 continue
 
-            # Check if clip should start playing
-            clip_start = clip.start_time
-            clip_end = clip.start_time + clip.duration
+            # Calculate offset within the clip
+            offset = position - clip_start
+            logger.debug(f"🎯 Triggering clip {clip.id} at position {position:.2f} (clip range: {clip_start:.2f}-{clip_end:.2f})")
+            await self._trigger_clip(clip, track, offset)
+
+    def _resolve_track_sample_path(self, track: Track, sample_id: str) -> Optional[Path]:
+        """Find the audio file for a track-level sample (explicit path first, then data/samples/)"""
+        logger.info(f"🔍 Looking for sample: {sample_id}")
+
+        # If sample_file_path is set and exists, use it
+        if track.sample_file_path:
+            potential_path = Path(track.sample_file_path)
+            if potential_path.exists():
+                return potential_path
+
+        # Try to find the file in data/samples/ with any extension
+        for ext in SAMPLE_EXTENSIONS:
+            potential_path = SAMPLES_DIR / f"{sample_id}{ext}"
+            if potential_path.exists():
+                logger.info(f"   ✅ Found: {potential_path}")
+                return potential_path
+
+        logger.error(f"❌ Sample file not found for track sample ID: {sample_id}")
+        logger.error(f"   Searched in: {SAMPLES_DIR}")
+        logger.error(f"   track.sample_file_path was: {track.sample_file_path}")
+        return None
+
+    def _resolve_clip_audio_path(self, clip: Clip) -> Optional[Path]:
+        """Find the audio file for a clip (a sample ID in data/samples/, or a file path)"""
+        audio_file_path = clip.audio_file_path
+
+        # It's already a path: resolve relative paths against the project root
+        if audio_file_path.endswith(SAMPLE_EXTENSIONS):
+            audio_path = Path(audio_file_path)
+            return audio_path if audio_path.is_absolute() else PROJECT_ROOT / audio_path
+
+        # Otherwise it's a sample ID (UUID): try data/samples/ with any extension
+        for ext in SAMPLE_EXTENSIONS:
+            potential_path = SAMPLES_DIR / f"{audio_file_path}{ext}"
+            if potential_path.exists():
+                return potential_path
+
+        logger.error(f"❌ Sample file not found for ID: {audio_file_path}")
+        return None
+
+    async def _ensure_track_bus(self, track: Track) -> int:
+        """Get the track's audio bus, allocating it and its mixer channel on first use (0 = master)"""
+        if not (self.audio_bus_manager and self.mixer_channel_service):
+            return 0  # Default to master bus
+
+        track_bus = self.audio_bus_manager.get_track_bus(track.id)
+        if track_bus is None:
+            # Allocate bus and create mixer channel for this track
+            track_bus = self.audio_bus_manager.allocate_track_bus(track.id)
+            await self.mixer_channel_service.create_mixer_channel(
+                track_id=track.id,
+                volume=track.volume,
+                pan=track.pan,
+                mute=track.is_muted,
+                solo=track.is_solo
+            )
+            logger.info(f"🎚️ Created mixer channel for track {track.id} on bus {track_bus}")
+        return track_bus
+
+    def _spawn_sample_player(self, clip: Clip, buffer_key: str, buffer_num: int, track_bus: int) -> int:
+        """
+        Start a samplePlayer synth for an audio clip (TIMELINE PLAYBACK)
 
-            # Check if playhead is within clip range
-            if clip_start <= position < clip_end:
-                # Check if this clip is already playing
-                if clip.id not in self.timeline_active_synths:
-                    # Calculate offset within the clip
-                    offset = position - clip_start
-                    logger.info(f"🎯 Triggering clip {clip.id} at position {position:.2f} (clip range: {clip_start:.2f}-{clip_end:.2f})")
-                    await self._trigger_clip(clip, track, offset)
+        Args:
+            clip: Audio clip being played (offset, rate, fades, loop/reverse)
+            buffer_key: BufferManager key the buffer was loaded under
+            buffer_num: SuperCollider buffer number
+            track_bus: Output bus for the track
+
+        Returns:
+            Node ID of the new synth
+        """
+        node_id = self.engine_manager.allocate_node_id()
+
+        # Calculate playback parameters
+        buf_duration = self.buffer_manager.get_buffer_duration(buffer_key)
+        audio_offset_secs = clip.audio_offset or 0.0
+        if buf_duration > 0:
+            start_pos = min(audio_offset_secs / buf_duration, 1.0)
+            end_pos = min(clip.audio_end / buf_duration, 1.0) if clip.audio_end is not None else 1.0
+        else:
+            start_pos = 0.0
+            end_pos = 1.0
+
+        # Combined rate: playback_rate * pitch shift (semitones -> ratio)
+        rate = clip.playback_rate * (2.0 ** (clip.pitch_semitones / 12.0))
+        loop_enabled = 1 if clip.loop_enabled else 0
+        reverse = 1 if clip.reverse else 0
+
+        self.engine_manager.send_sample_player(
+            node_id,
+            0,  # addAction: add to head
+            1,  # target: default group
+            bufnum=buffer_num,
+            rate=rate,
+            amp=clip.gain,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            fade_in=max(clip.fade_in, 0.005),   # minimum 5ms to avoid clicks
+            fade_out=max(clip.fade_out, 0.05),  # minimum 50ms for clean tail
+            reverse=reverse,
+            loop=loop_enabled,
+            gate=1,
+            out=track_bus
+        )
+
+        self.timeline_active_synths[clip.id] = node_id
+        logger.debug(f"   rate={rate:.3f}, start={start_pos:.3f}, end={end_pos:.3f}, reverse={reverse}, loop={loop_enabled}")
+        return node_id
 
     async def _trigger_clip(self, clip: Clip, track: Track, offset: float = 0.0) -> None:
         """
@@ -597,8 +822,6 @@ class PlaybackEngineService:
             track: Track containing the clip
             offset: Offset within the clip in beats
         """
-        from pathlib import Path
-
         if not self.engine_manager or not self.buffer_manager:
             logger.warning("⚠️ Cannot trigger clip: engine_manager or buffer_manager not available")
             return
@@ -606,221 +829,67 @@ class PlaybackEngineService:
         try:
             # Handle audio clips whose sample is referenced via the track (track-level sample_id)
             if track.type == "audio" and track.sample_id:
-                # Load sample into buffer if not already loaded
+                # Load sample into buffer if not already loaded - the file lookup
+                # only runs on a buffer miss, never for an already-loaded sample
                 sample_id = track.sample_id or track.id
-                logger.info(f"🔍 Looking for sample: {sample_id}")
-
-                # Resolve sample file path
-                sample_path = None
-
-                # If sample_file_path is set and exists, use it
-                if track.sample_file_path:
-                    potential_path = Path(track.sample_file_path)
-                    logger.info(f"   Checking track.sample_file_path: {potential_path}")
-                    if potential_path.exists():
-                        sample_path = potential_path
-                        logger.info(f"   ✅ Found at: {sample_path}")
-
-                # If not found, search in data/samples/ directory
-                if not sample_path:
-                    # Go from backend/services/daw/ -> backend/services -> backend -> project_root -> project_root/data/samples
-                    samples_dir = Path(__file__).parent.parent.parent.parent / "data" / "samples"
-                    logger.info(f"   Searching in: {samples_dir}")
-
-                    # Try to find the file with any extension
-                    for ext in ['.webm', '.wav', '.mp3', '.ogg', '.flac']:
-                        potential_path = samples_dir / f"{sample_id}{ext}"
-                        logger.info(f"   Trying: {potential_path}")
-                        if potential_path.exists():
-                            sample_path = potential_path
-                            logger.info(f"   ✅ Found: {sample_path}")
-                            break
-
-                if not sample_path:
-                    logger.error(f"❌ Sample file not found for track sample ID: {sample_id}")
-                    logger.error(f"   Searched in: {samples_dir}")
-                    logger.error(f"   track.sample_file_path was: {track.sample_file_path}")
-                    return
-
-                buffer_num = await self.buffer_manager.load_sample(sample_id, str(sample_path))
-
-                # Allocate node ID for the synth
-                node_id = self.engine_manager.allocate_node_id()
-
-                # Get or allocate audio bus for this track
-                track_bus = 0  # Default to master bus
-                if self.audio_bus_manager and self.mixer_channel_service:
-                    track_bus = self.audio_bus_manager.get_track_bus(track.id)
-                    if track_bus is None:
-                        # Allocate bus and create mixer channel for this track
-                        track_bus = self.audio_bus_manager.allocate_track_bus(track.id)
-                        await self.mixer_channel_service.create_mixer_channel(
-                            track_id=track.id,
-                            volume=track.volume,
-                            pan=track.pan,
-                            mute=track.is_muted,
-                            solo=track.is_solo
-                        )
-                        logger.info(f"🎚️ Created mixer channel for track {track.id} on bus {track_bus}")
-
-                # Calculate playback parameters
-                buf_duration = self.buffer_manager.get_buffer_duration(sample_id) if self.buffer_manager else 0.0
-                audio_offset_secs = clip.audio_offset or 0.0
-                if buf_duration > 0:
-                    start_pos = min(audio_offset_secs / buf_duration, 1.0)
-                    end_pos = min(clip.audio_end / buf_duration, 1.0) if clip.audio_end is not None else 1.0
-                else:
-                    start_pos = 0.0
-                    end_pos = 1.0
-
-                # Combined rate: playback_rate * pitch shift (semitones -> ratio)
-                rate = clip.playback_rate * (2.0 ** (clip.pitch_semitones / 12.0))
-                loop_enabled = 1 if clip.loop_enabled else 0
-                reverse = 1 if clip.reverse else 0
-
-                self.engine_manager.send_message(
-                    "/s_new",
-                    "samplePlayer",
-                    node_id,
-                    0,  # addAction: add to head
-                    1,  # target: default group
-                    "bufnum", buffer_num,
-                    "rate", rate,
-                    "amp", clip.gain,
-                    "startPos", start_pos,
-                    "endPos", end_pos,
-                    "fadeIn", max(clip.fade_in, 0.005),   # minimum 5ms to avoid clicks
-                    "fadeOut", max(clip.fade_out, 0.05),  # minimum 50ms for clean tail
-                    "reverse", reverse,
-                    "loop", loop_enabled,
-                    "gate", 1,
-                    "out", track_bus
-                )
+                buffer_num = self.buffer_manager.get_buffer(sample_id)
+                if buffer_num is None:
+                    sample_path = self._resolve_track_sample_path(track, sample_id)
+                    if not sample_path:
+                        return
+                    buffer_num = await self.buffer_manager.load_sample(sample_id, str(sample_path))
 
-                self.timeline_active_synths[clip.id] = node_id
+                track_bus = await self._ensure_track_bus(track)
+                node_id = self._spawn_sample_player(clip, sample_id, buffer_num, track_bus)
                 logger.info(f"🎵 Triggered sample clip {clip.id} (node {node_id}, buf {buffer_num}, sample: {track.sample_name})")
-                logger.info(f"   rate={rate:.3f}, start={start_pos:.3f}, end={end_pos:.3f}, reverse={reverse}, loop={loop_enabled}")
 
             # Handle audio clips (clip has audio file path but track has no sample_id)
             elif clip.type == "audio" and clip.audio_file_path and not track.sample_id:
-                # Resolve audio file path
-                audio_file_path = clip.audio_file_path
-                audio_path = None
-
-                # If it's just a sample ID (UUID), construct path to data/samples/
-                if not audio_file_path.endswith(('.wav', '.mp3', '.webm', '.ogg', '.flac')):
-                    # Assume it's a sample ID, construct full path
-                    samples_dir = Path(__file__).parent.parent.parent.parent / "data" / "samples"
-
-                    # Try to find the file with any extension
-                    for ext in ['.webm', '.wav', '.mp3', '.ogg', '.flac']:
-                        potential_path = samples_dir / f"{audio_file_path}{ext}"
-                        if potential_path.exists():
-                            audio_path = potential_path
-                            break
-
+                # Load the clip's audio into a buffer if not already loaded
+                buffer_num = self.buffer_manager.get_buffer(clip.id)
+                if buffer_num is None:
+                    audio_path = self._resolve_clip_audio_path(clip)
                     if not audio_path:
-                        logger.error(f"❌ Sample file not found for ID: {audio_file_path}")
                         return
-                else:
-                    # It's already a path, resolve it
-                    audio_path = Path(audio_file_path)
-                    if not audio_path.is_absolute():
-                        # Make it relative to project root
-                        audio_path = Path(__file__).parent.parent.parent / audio_path
-
-                buffer_num = await self.buffer_manager.load_sample(clip.id, str(audio_path))
-
-                # Allocate node ID for the synth
-                node_id = self.engine_manager.allocate_node_id()
-
-                # Get or allocate audio bus for this track
-                track_bus = 0  # Default to master bus
-                if self.audio_bus_manager and self.mixer_channel_service:
-                    track_bus = self.audio_bus_manager.get_track_bus(track.id)
-                    if track_bus is None:
-                        # Allocate bus and create mixer channel for this track
-                        track_bus = self.audio_bus_manager.allocate_track_bus(track.id)
-                        await self.mixer_channel_service.create_mixer_channel(
-                            track_id=track.id,
-                            volume=track.volume,
-                            pan=track.pan,
-                            mute=track.is_muted,
-                            solo=track.is_solo
-                        )
-                        logger.info(f"🎚️ Created mixer channel for track {track.id} on bus {track_bus}")
-
-                # Calculate playback parameters
-                buf_duration = self.buffer_manager.get_buffer_duration(clip.id) if self.buffer_manager else 0.0
-                audio_offset_secs = clip.audio_offset or 0.0
-                if buf_duration > 0:
-                    start_pos = min(audio_offset_secs / buf_duration, 1.0)
-                    end_pos = min(clip.audio_end / buf_duration, 1.0) if clip.audio_end is not None else 1.0
-                else:
-                    start_pos = 0.0
-                    end_pos = 1.0
-
-                # Combined rate: playback_rate * pitch shift (semitones -> ratio)
-                rate = clip.playback_rate * (2.0 ** (clip.pitch_semitones / 12.0))
-                loop_enabled = 1 if clip.loop_enabled else 0
-                reverse = 1 if clip.reverse else 0
-
-                self.engine_manager.send_message(
-                    "/s_new",
-                    "samplePlayer",
-                    node_id,
-                    0,  # addAction: add to head
-                    1,  # target: default group
-                    "bufnum", buffer_num,
-                    "rate", rate,
-                    "amp", clip.gain,
-                    "startPos", start_pos,
-                    "endPos", end_pos,
-                    "fadeIn", max(clip.fade_in, 0.005),   # minimum 5ms to avoid clicks
-                    "fadeOut", max(clip.fade_out, 0.05),  # minimum 50ms for clean tail
-                    "reverse", reverse,
-                    "loop", loop_enabled,
-                    "gate", 1,
-                    "out", track_bus
-                )
+                    buffer_num = await self.buffer_manager.load_sample(clip.id, str(audio_path))
 
-                self.timeline_active_synths[clip.id] = node_id
+                track_bus = await self._ensure_track_bus(track)
+                node_id = self._spawn_sample_player(clip, clip.id, buffer_num, track_bus)
                 logger.info(f"🎵 Triggered audio clip {clip.id} (node {node_id}, buf {buffer_num})")
-                logger.info(f"   rate={rate:.3f}, start={start_pos:.3f}, end={end_pos:.3f}, reverse={reverse}, loop={loop_enabled}")
 
             # Handle MIDI clips
             elif clip.type == "midi" and clip.midi_events:
-                logger.info(f"🎹 MIDI CLIP TRIGGERED:")
-                logger.info(f"   Clip ID: {clip.id}")
-                logger.info(f"   Clip type: {clip.type}")
-                logger.info(f"   MIDI events count: {len(clip.midi_events)}")
-                logger.info(f"   Offset: {offset:.2f} beats")
-
                 # Get instrument synthdef from track — kit tracks route per note
                 synthdef = track.instrument or "sine"
                 kit_params_default: dict = {}
-                logger.info(f"   Instrument: {synthdef}")
-
-                # Get or allocate audio bus for this track
-                track_bus = 0  # Default to master bus
-                if self.audio_bus_manager and self.mixer_channel_service:
-                    track_bus = self.audio_bus_manager.get_track_bus(track.id)
-                    if track_bus is None:
-                        # Allocate bus and create mixer channel for this track
-                        track_bus = self.audio_bus_manager.allocate_track_bus(track.id)
-                        await self.mixer_channel_service.create_mixer_channel(
-                            track_id=track.id,
-                            volume=track.volume,
-                            pan=track.pan,
-                            mute=track.is_muted,
-                            solo=track.is_solo
-                        )
-                        logger.info(f"🎚️ Created mixer channel for track {track.id} on bus {track_bus}")
-
-                # Trigger each MIDI note with scheduled start time
+                logger.info(f"🎹 MIDI clip triggered: {clip.id} ({len(clip.midi_events)} events, offset {offset:.2f} beats, instrument {synthdef})")
+
+                # Per-note logs are only formatted when DEBUG is enabled
+                debug_notes = logger.isEnabledFor(logging.DEBUG)
+
+                track_bus = await self._ensure_track_bus(track)
+
+                # Schedule every note on scsynth as timestamped OSC bundles (grouped
+                # by time, so chords share one bundle): the server fires them
+                # sample-accurately, and Python keeps only cheap event-loop timers
+                # that send each group just ahead of time and maintain the
+                # active-note list for the UI
+                event_loop = asyncio.get_running_loop()
+                wall_now = time.time()
+                note_ons: Dict[float, list] = {}
+                # start delay -> release time -> gate-off messages, so each onset
+                # group is sent together with its own releases
+                note_offs: Dict[float, Dict[float, list]] = {}
+                note_starts: Dict[float, List[Tuple[int, ActiveMIDINote]]] = {}
+                note_releases: Dict[float, List[int]] = {}
                 triggered_count = 0
+
+                # Loop invariants, hoisted out of the per-note loop
+                seconds_per_beat = 60.0 / self.tempo
+                amp_scale = 0.8 * clip.gain / 127.0
                 for note in clip.midi_events:
-                    logger.info(f"   Checking note: {note.note_name} (start={note.start_time:.2f}, duration={note.duration:.2f}, end={note.start_time + note.duration:.2f})")
+                    if debug_notes:
+                        logger.debug(f"   Checking note: {note.note_name} (start={note.start_time:.2f}, duration={note.duration:.2f}, end={note.start_time + note.duration:.2f})")
 
                     # ── Apply MIDI clip transforms ──────────────────────────
                     # 1. Quantize: blend toward nearest 1/4-beat grid position
@@ -850,7 +919,7 @@ class PlaybackEngineService:
                     if effective_start >= offset:
                         # Note hasn't started yet - schedule it
                         delay_beats = effective_start - offset
-                        delay_seconds = delay_beats * (60.0 / self.tempo)
+                        delay_seconds = delay_beats * seconds_per_beat
 
                         node_id = self.engine_manager.allocate_node_id()
 
@@ -863,90 +932,153 @@ class PlaybackEngineService:
                             note_kit_params = dict(pad.params)
 
                         # Convert MIDI note to frequency (uses transposed note)
-                        freq = 440.0 * (2.0 ** ((effective_note - 69) / 12.0))
+                        freq = MIDI_NOTE_FREQUENCIES[effective_note]
 
                         # Calculate amplitude (apply effective velocity and clip gain only - track volume handled by mixer)
-                        amp = effective_velocity / 127.0 * 0.8 * clip.gain
+                        amp = effective_velocity * amp_scale
 
                         triggered_count += 1
-                        logger.info(f"      ✅ SCHEDULED! node={node_id}, synth={note_synthdef}, freq={freq:.2f}Hz, amp={amp:.2f}, delay={delay_seconds:.2f}s, bus={track_bus}")
-
-                        # Schedule note start and release
-                        # FIX: Pass note_start_time as parameter to avoid Python closure bug
-                        async def play_note(nid, freq_val, amp_val, synth, delay, dur_beats, note_pitch, note_start_time, clip_id_val, out_bus, extra_params):
-                            try:
-                                logger.info(f"⏰ MIDI Note Task Started: nid={nid}, delay={delay:.3f}s, synth={synth}, freq={freq_val:.2f}Hz, amp={amp_val:.3f}, bus={out_bus}")
-                                await asyncio.sleep(delay)
-
-                                if self.engine_manager and self.is_playing:
-                                    logger.info(f"🎵 TRIGGERING MIDI NOTE: nid={nid}, synth={synth}, freq={freq_val:.2f}Hz, amp={amp_val:.3f}, gate=1, out={out_bus}")
-
-                                    # Build OSC args; append kit pad overrides after base params
-                                    osc_args = [
-                                        "/s_new", synth, nid, 0, 1,
-                                        "freq", freq_val,
-                                        "amp", amp_val,
-                                        "gate", 1,
-                                        "out", out_bus,
-                                    ]
-                                    for k, v in extra_params.items():
-                                        osc_args += [k, v]
-
-                                    # Start the note
-                                    self.engine_manager.send_message(*osc_args)
-
-                                    # Track active note for visual feedback (TIMELINE PLAYBACK)
-                                    self.timeline_active_midi_notes[nid] = {
-                                        "clip_id": clip_id_val,
-                                        "note": note_pitch,
-                                        "start_time": note_start_time,  # FIX: Use parameter instead of closure variable
-                                        "wall_time": time.time()  # Wall clock time for debugging
-                                    }
-                                    logger.info(f"✅ MIDI note {nid} STARTED: pitch={note_pitch}, start_time={note_start_time}, clip={clip_id_val}")
-
-                                    # Schedule release
-                                    note_duration = dur_beats * (60.0 / self.tempo)
-                                    logger.info(f"⏱️  MIDI note {nid} will release in {note_duration:.3f}s")
-                                    await asyncio.sleep(note_duration)
-
-                                    if self.engine_manager:
-                                        logger.info(f"🔇 RELEASING MIDI note {nid}: sending gate=0")
-                                        self.engine_manager.send_message("/n_set", nid, "gate", 0)
-
-                                    # Remove from active notes (TIMELINE PLAYBACK)
-                                    if nid in self.timeline_active_midi_notes:
-                                        del self.timeline_active_midi_notes[nid]
-                                    logger.info(f"✅ MIDI note {nid} RELEASED")
-                                else:
-                                    logger.warning(f"⚠️  MIDI note {nid} NOT triggered: engine_manager={self.engine_manager is not None}, is_playing={self.is_playing}")
-
-                            except asyncio.CancelledError:
-                                # Task was cancelled (pause/stop was called)
-                                logger.info(f"🛑 MIDI note {nid} task CANCELLED")
-                                # Free the synth if it was started (TIMELINE PLAYBACK)
-                                if nid in self.timeline_active_midi_notes:
-                                    if self.engine_manager:
-                                        self.engine_manager.send_message("/n_free", nid)
-                                    del self.timeline_active_midi_notes[nid]
-                                raise  # Re-raise to mark task as cancelled
-                            except Exception as e:
-                                logger.error(f"❌ MIDI note {nid} task FAILED: {e}", exc_info=True)
-
-                        task = asyncio.create_task(play_note(node_id, freq, amp, note_synthdef, delay_seconds, effective_duration, effective_note, effective_start, clip.id, track_bus, note_kit_params))
-                        self.timeline_midi_note_tasks.add(task)
-                        # Remove task from set when it completes
-                        task.add_done_callback(self.timeline_midi_note_tasks.discard)
+                        if debug_notes:
+                            logger.debug(f"      ✅ SCHEDULED! node={node_id}, synth={note_synthdef}, freq={freq:.2f}Hz, amp={amp:.2f}, delay={delay_seconds:.2f}s, bus={track_bus}")
+
+                        # Queue note start and release
+                        osc_args = [
+                            note_synthdef, node_id, 0, 1,
+                            "freq", freq,
+                            "amp", amp,
+                            "gate", 1,
+                            "out", track_bus,
+                        ]
+                        for k, v in note_kit_params.items():
+                            osc_args += [k, v]
+                        release_seconds = delay_seconds + effective_duration * seconds_per_beat
+                        note_ons.setdefault(delay_seconds, []).append(("/s_new", osc_args))
+                        note_offs.setdefault(delay_seconds, {}).setdefault(wall_now + release_seconds, []).append(
+                            ("/n_set", [node_id, "gate", 0])
+                        )
+
+                        note_info = ActiveMIDINote(clip.id, effective_note, effective_start, wall_now + delay_seconds)
+                        note_starts.setdefault(delay_seconds, []).append((node_id, note_info))
+                        note_releases.setdefault(release_seconds, []).append(node_id)
+                        self.timeline_scheduled_notes[node_id] = wall_now + delay_seconds
                     else:
-                        logger.info(f"      ❌ SKIPPED (note already passed: offset={offset:.2f}, effective_start={effective_start:.2f})")
+                        if debug_notes:
+                            logger.debug(f"      ❌ SKIPPED (note already passed: offset={offset:.2f}, effective_start={effective_start:.2f})")
+
+                # Groups starting within the lookahead go out now, later ones on a timer
+                for delay, messages in sorted(note_ons.items()):
+                    group = (
+                        wall_now + delay if delay > 0 else None,
+                        messages,
+                        note_offs[delay],
+                        [node_id for node_id, _ in note_starts[delay]],
+                    )
+                    send_in = delay - MIDI_SCHEDULE_LOOKAHEAD_SECONDS
+                    if send_in <= 0:
+                        self._send_scheduled_midi_notes(*group)
+                    else:
+                        self._add_note_timer(event_loop, send_in, self._send_scheduled_midi_notes, *group)
+
+                # UI bookkeeping timers, coalesced the same way: one per distinct time
+                # (starts are registered first so equal-time releases run after them)
+                for delay, started in note_starts.items():
+                    self._add_note_timer(event_loop, delay, self._start_scheduled_midi_notes, started)
+                for delay, released in note_releases.items():
+                    self._add_note_timer(event_loop, delay, self._release_scheduled_midi_notes, released)
 
                 logger.info(f"   Total notes scheduled: {triggered_count}/{len(clip.midi_events)}")
 
                 # Track that this MIDI clip is active (for stopping when playhead leaves clip range) - TIMELINE PLAYBACK
-                self.timeline_active_synths[clip.id] = self.engine_manager.allocate_node_id()  # Dummy node ID for tracking
+                self.timeline_active_synths[clip.id] = MIDI_CLIP_SENTINEL
 
         except Exception as e:
             logger.error(f"❌ Failed to trigger clip {clip.id}: {e}")
 
+    def _free_nodes(self, node_ids) -> None:
+        """Free synth nodes with a single variadic /n_free message (one UDP packet)"""
+        node_ids = [node_id for node_id in node_ids if node_id != MIDI_CLIP_SENTINEL]
+        if node_ids and self.engine_manager:
+            self.engine_manager.send_message("/n_free", *node_ids)
+
+    def _send_scheduled_midi_notes(
+        self,
+        start_at: Optional[float],
+        note_ons: list,
+        note_offs: Dict[float, list],
+        node_ids: List[int],
+    ) -> None:
+        """
+        Send one group of timeline MIDI notes to scsynth (TIMELINE PLAYBACK)
+
+        The onset bundle and the release bundles of the same notes go out
+        together, so a release is never scheduled without its onset or left
+        behind once the onset is on the server.
+
+        Args:
+            start_at: Wall-clock start time, or None for immediately
+            note_ons: /s_new messages starting at start_at
+            note_offs: Release wall-clock time -> /n_set gate 0 messages for these notes
+            node_ids: Node IDs created by note_ons
+        """
+        try:
+            self.engine_manager.send_bundle(start_at, note_ons)
+        except Exception as e:
+            logger.error(f"❌ Failed to schedule {len(node_ids)} MIDI note(s): {e}")
+            return
+        # Note-ons first so a zero-length note can't have its release land before its start
+        for release_at, messages in sorted(note_offs.items()):
+            self.engine_manager.send_bundle(release_at, messages)
+        self.timeline_sent_notes.update(node_ids)
+
+    def _start_scheduled_midi_notes(self, started: List[Tuple[int, ActiveMIDINote]]) -> None:
+        """Mark pre-scheduled MIDI notes as sounding (TIMELINE PLAYBACK, UI feedback only)"""
+        self.timeline_active_midi_notes.update(started)
+
+    def _release_scheduled_midi_notes(self, node_ids: List[int]) -> None:
+        """Forget pre-scheduled MIDI notes once scsynth has released them (TIMELINE PLAYBACK)"""
+        for node_id in node_ids:
+            self.timeline_active_midi_notes.pop(node_id, None)
+            self.timeline_scheduled_notes.pop(node_id, None)
+            self.timeline_sent_notes.discard(node_id)
+
+    def _add_note_timer(self, event_loop: asyncio.AbstractEventLoop, delay: float, callback, *args) -> None:
+        """Schedule a timeline MIDI timer that drops itself from timeline_note_timers when it fires"""
+        def fire() -> None:
+            self.timeline_note_timers.discard(handle)
+            callback(*args)
+
+        handle = event_loop.call_later(delay, fire)
+        self.timeline_note_timers.add(handle)
+
+    def _cancel_scheduled_midi_notes(self) -> None:
+        """
+        Cancel scheduled timeline MIDI notes by node ID (TIMELINE PLAYBACK)
+
+        Notes still inside the lookahead were never sent, so cancelling their
+        timers is enough. Notes already on scsynth are freed at their start
+        time: a /n_free bundle with the same timetag runs right after their
+        /s_new, and one whose start has passed runs immediately. Callers
+        still free timeline_active_midi_notes.
+        """
+        if not self.timeline_scheduled_notes:
+            return
+
+        for handle in self.timeline_note_timers:
+            handle.cancel()
+        self.timeline_note_timers.clear()
+
+        now = time.time()
+        frees: Dict[Optional[float], List[int]] = {}
+        for node_id, start_at in self.timeline_scheduled_notes.items():
+            if node_id in self.timeline_sent_notes and node_id not in self.timeline_active_midi_notes:
+                frees.setdefault(start_at if start_at > now else None, []).append(node_id)
+        self.timeline_scheduled_notes.clear()
+        self.timeline_sent_notes.clear()
+
+        if self.engine_manager:
+            for start_at, node_ids in frees.items():
+                self.engine_manager.send_bundle(start_at, [("/n_free", node_ids)])
+
     async def stop_playback(self):
         """Stop playback"""
         # Get current composition to update its state
@@ -972,9 +1104,7 @@ class PlaybackEngineService:
             self.playback_task = None
 
         # Stop all active synths (sample/audio clips) - TIMELINE PLAYBACK
-        if self.engine_manager:
-            for node_id in self.timeline_active_synths.values():
-                self.engine_manager.send_message("/n_free", node_id)
+        self._free_nodes(self.timeline_active_synths.values())
         self.timeline_active_synths.clear()
 
         # Cancel all scheduled MIDI note tasks - TIMELINE PLAYBACK
@@ -983,11 +1113,10 @@ class PlaybackEngineService:
         if self.timeline_midi_note_tasks:
             await asyncio.gather(*self.timeline_midi_note_tasks, return_exceptions=True)
         self.timeline_midi_note_tasks.clear()
+        self._cancel_scheduled_midi_notes()
 
         # Stop all active MIDI notes (use /n_free for immediate silence) - TIMELINE PLAYBACK
-        if self.engine_manager:
-            for node_id in self.timeline_active_midi_notes.keys():
-                self.engine_manager.send_message("/n_free", node_id)
+        self._free_nodes(self.timeline_active_midi_notes.keys())
         self.timeline_active_midi_notes.clear()
 
         # Broadcast stopped state via WebSocket
@@ -996,9 +1125,7 @@ class PlaybackEngineService:
                 self.composition_state_service.current_composition_id
             )
             if composition:
-                time_sig_parts = composition.time_signature.split("/")
-                time_sig_num = int(time_sig_parts[0]) if len(time_sig_parts) > 0 else 4
-                time_sig_den = int(time_sig_parts[1]) if len(time_sig_parts) > 1 else 4
+                time_sig_num, time_sig_den = _parse_time_signature(composition.time_signature)
 
                 transport_data = {
                     "type": "transport",
@@ -1042,7 +1169,7 @@ class PlaybackEngineService:
         if self.engine_manager:
             for clip_id, node_id in self.timeline_active_synths.items():
                 logger.info(f"🛑 Freeing synth node {node_id} for clip {clip_id}")
-                self.engine_manager.send_message("/n_free", node_id)
+            self._free_nodes(self.timeline_active_synths.values())
         else:
             logger.warning("⚠️ No engine_manager available to free synths!")
         self.timeline_active_synths.clear()
@@ -1054,13 +1181,13 @@ class PlaybackEngineService:
         if self.timeline_midi_note_tasks:
             await asyncio.gather(*self.timeline_midi_note_tasks, return_exceptions=True)
         self.timeline_midi_note_tasks.clear()
+        self._cancel_scheduled_midi_notes()
 
         # Stop all active MIDI notes (use /n_free for immediate silence) - TIMELINE PLAYBACK
         logger.info(f"🛑 Stopping {len(self.timeline_active_midi_notes)} active MIDI notes")
-        if self.engine_manager:
-            for node_id, note_info in self.timeline_active_midi_notes.items():
-                logger.info(f"🛑 Freeing MIDI note node {node_id} (note={note_info['note']}, clip={note_info['clip_id']})")
-                self.engine_manager.send_message("/n_free", node_id)
+        for node_id, note_info in self.timeline_active_midi_notes.items():
+            logger.info(f"🛑 Freeing MIDI note node {node_id} (note={note_info.note}, clip={note_info.clip_id})")
+        self._free_nodes(self.timeline_active_midi_notes.keys())
         self.timeline_active_midi_notes.clear()
 
         # Broadcast paused state via WebSocket
@@ -1069,9 +1196,7 @@ class PlaybackEngineService:
                 self.composition_state_service.current_composition_id
             )
             if composition:
-                time_sig_parts = composition.time_signature.split("/")
-                time_sig_num = int(time_sig_parts[0]) if len(time_sig_parts) > 0 else 4
-                time_sig_den = int(time_sig_parts[1]) if len(time_sig_parts) > 1 else 4
+                time_sig_num, time_sig_den = _parse_time_signature(composition.time_signature)
 
                 transport_data = {
                     "type": "transport",
@@ -1149,7 +1274,7 @@ class PlaybackEngineService:
         logger.info(f"🎵 Set tempo to {tempo} BPM for composition {composition_id}")
 
         # If playing, reschedule MIDI notes at the new tempo.
-        # Already-sleeping asyncio tasks were calculated at the old tempo and won't
+        # Already-scheduled notes were timed at the old tempo and won't
         # adjust automatically — cancel them so the next playback loop iteration
         # re-triggers all active MIDI clips at the correct timing for the new tempo.
         if self.is_playing:
@@ -1159,19 +1284,17 @@ class PlaybackEngineService:
             if self.timeline_midi_note_tasks:
                 await asyncio.gather(*self.timeline_midi_note_tasks, return_exceptions=True)
             self.timeline_midi_note_tasks.clear()
+            self._cancel_scheduled_midi_notes()
 
             # Free all currently-sounding MIDI notes
-            if self.engine_manager:
-                for node_id in list(self.timeline_active_midi_notes.keys()):
-                    self.engine_manager.send_message("/n_free", node_id)
+            self._free_nodes(self.timeline_active_midi_notes.keys())
             self.timeline_active_midi_notes.clear()
 
             # Remove MIDI clips from active-synth tracking so _check_and_trigger_clips
             # re-triggers them on the very next playback loop tick with the new tempo
-            midi_track_ids = {t.id for t in composition.tracks if t.type == "midi"}
             clips_retriggered = [
-                clip_id for clip_id, _ in list(self.timeline_active_synths.items())
-                if any(c.id == clip_id and c.track_id in midi_track_ids for c in composition.clips)
+                clip_id for clip_id, node_id in self.timeline_active_synths.items()
+                if node_id == MIDI_CLIP_SENTINEL
             ]
             for clip_id in clips_retriggered:
                 del self.timeline_active_synths[clip_id]
@@ -1619,7 +1742,7 @@ class PlaybackEngineService:
             node_id = self.engine_manager.allocate_node_id()
 
             # Convert MIDI note to frequency (FIX: use note.note, not note.pitch)
-            freq = 440.0 * (2.0 ** ((note.note - 69) / 12.0))
+            freq = MIDI_NOTE_FREQUENCIES[note.note]
 
             # Calculate duration in seconds
             duration_seconds = (note.duration / tempo) * 60.0
@@ -1683,10 +1806,10 @@ class PlaybackEngineService:
             task.cancel()
         self.triggered_clips.clear()
 
-        # Stop all playing clips - CLIP LAUNCHER
+        # Stop all playing clips with one /n_free (MIDI clips use negative IDs and own no synth) - CLIP LAUNCHER
         clip_ids = list(self.launcher_active_synths.keys())
-        for clip_id in clip_ids:
-            await self.stop_clip(clip_id)
+        self._free_nodes(node_id for node_id in self.launcher_active_synths.values() if node_id > 0)
+        self.launcher_active_synths.clear()
 
         # Cancel all MIDI note tasks (timeline tasks used for clip launcher MIDI)
         for task in self.timeline_midi_note_tasks:
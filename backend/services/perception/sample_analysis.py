@@ -11,6 +11,7 @@ This gives the AI a deep understanding of what sounds are being used.
 """
 import logging
 import hashlib
+import os
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict
@@ -24,6 +25,7 @@ except ImportError:
     LIBROSA_AVAILABLE = False
     logging.warning("librosa not available - sample analysis will be limited")
 
+from backend.services.audio.sample_metadata import load_metadata
 from backend.models.sample_analysis import (
     SampleAnalysis,
     SpectralFeatures,
@@ -424,20 +426,20 @@ class SampleAnalyzer:
         if samples_path.exists():
             return str(samples_path)
 
-        # Try loading metadata to resolve sample ID
-        metadata_file = self.samples_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    if file_path_or_id in metadata:
-                        file_name = metadata[file_path_or_id].get('file_name')
-                        if file_name:
-                            resolved_path = self.samples_dir / file_name
-                            if resolved_path.exists():
-                                return str(resolved_path)
-            except Exception as e:
-                logger.error(f"Failed to load sample metadata: {e}")
+        # Try loading metadata to resolve sample ID. Metadata writes are
+        # debounced, so read through load_metadata(), which also returns edits
+        # that haven't been flushed to metadata.json yet
+        try:
+            # Same path spelling as get_metadata_file(), which keys the pending writes
+            metadata = load_metadata(os.path.join(self.samples_dir, "metadata.json"))
+            if file_path_or_id in metadata:
+                file_name = metadata[file_path_or_id].get('file_name')
+                if file_name:
+                    resolved_path = self.samples_dir / file_name
+                    if resolved_path.exists():
+                        return str(resolved_path)
+        except Exception as e:
+            logger.error(f"Failed to load sample metadata: {e}")
 
         logger.warning(f"Could not resolve sample path: {file_path_or_id}")
         return None
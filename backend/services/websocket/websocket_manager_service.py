@@ -4,8 +4,9 @@ WebSocket Manager Service - Broadcasts audio data to connected clients
 Manages WebSocket connections and broadcasts real-time audio data
 """
 import logging
-import json
 from typing import Set, Dict, Any, Callable
+
+import orjson
 from fastapi import WebSocket
 
 from backend.models.types import SpectrumData, WaveformData, MeterData, TransportData
@@ -97,7 +98,8 @@ class WebSocketManager:
                 logger.debug(f"⚠️ No {meta['name'].lower()} clients connected, skipping broadcast")
             return
         
-        message = json.dumps(data)
+        # Serialize once for all clients (orjson; numpy scalars/arrays supported)
+        message = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
         disconnected = set()
         
         if debug_log:
@@ -40,6 +40,7 @@ export interface TransportMessage extends BaseWebSocketMessage {
     active_notes?: ActiveNote[];
     playing_clips?: string[];  // Clip IDs currently playing
     triggered_clips?: string[];  // Clip IDs waiting for quantization
+    osc_send_failures?: number;  // OSC packets dropped or failed on the way to scsynth
 }
 
 /**
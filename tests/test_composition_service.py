@@ -0,0 +1,323 @@
+"""
+Tests for composition persistence (CompositionService)
+"""
+import os
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from backend.models.composition import Composition, ChatMessage
+from backend.models.mixer import MixerState
+from backend.models.sequence import Track, Clip
+from backend.services.daw.composition_service import CompositionService
+
+
+@pytest.fixture
+def composition_service(tmp_path) -> CompositionService:
+    """CompositionService rooted in a temporary directory"""
+    return CompositionService(
+        storage_dir=tmp_path / "compositions",
+        samples_dir=tmp_path / "samples"
+    )
+
+
+@pytest.fixture
+def composition() -> Composition:
+    """Small composition with one track and two clips"""
+    return Composition(
+        id="comp-1",
+        name="Test Song",
+        tempo=100.0,
+        tracks=[Track(id="track-1", name="Lead", composition_id="comp-1", type="midi")],
+        clips=[
+            Clip(id="clip-1", name="A", type="midi", track_id="track-1", start_time=0.0, duration=4.0),
+            Clip(id="clip-2", name="B", type="midi", track_id="track-1", start_time=4.0, duration=8.0),
+        ],
+    )
+
+
+def test_save_and_load_roundtrip(composition_service, composition):
+    """Test that a saved composition loads back unchanged"""
+    composition_service.save_composition(composition)
+
+    loaded = composition_service.load_composition(composition.id)
+
+    assert loaded is not None
+    assert loaded.name == "Test Song"
+    assert [c.id for c in loaded.clips] == ["clip-1", "clip-2"]
+
+
+def test_load_reuses_saved_bytes_until_file_changes(composition_service, composition):
+    """Test that a load right after a save skips the disk read but honours later edits"""
+    composition_service.save_composition(composition, create_history=False)
+    composition.name = "Mutated in memory"
+
+    assert composition_service.load_composition(composition.id).name == "Test Song"
+
+    current_file = composition_service.storage_dir / composition.id / "current.json"
+    data = orjson.loads(current_file.read_bytes())
+    data["name"] = "Edited on disk"
+    current_file.write_bytes(orjson.dumps(data))
+    st = current_file.stat()
+    os.utime(current_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+    assert composition_service.load_composition(composition.id).name == "Edited on disk"
+
+
+def test_list_compositions_uses_metadata_sidecar(composition_service, composition):
+    """Test that listing reports stats from the metadata sidecar"""
+    composition_service.save_composition(composition)
+
+    assert (composition_service.storage_dir / composition.id / "metadata.json").exists()
+
+    [meta] = composition_service.list_compositions()
+    assert meta.id == composition.id
+    assert meta.tempo == 100.0
+    assert meta.track_count == 1
+    assert meta.clip_count == 2
+    assert meta.duration_beats == 12.0
+    assert meta.has_autosave is False
+
+
+def test_save_refreshes_listing_cache(composition_service, composition):
+    """Test that a save updates the cached listing entry without a re-read"""
+    composition_service.save_composition(composition)
+    composition_service.list_compositions()
+
+    composition.name = "Renamed"
+    composition_service.save_composition(composition, create_history=False)
+
+    [meta] = composition_service.list_compositions()
+    assert meta.name == "Renamed"
+    assert meta is composition_service._metadata_cache[composition.id][1]
+
+
+def test_batch_defers_fsync_until_exit(composition_service, composition, monkeypatch):
+    """Test that saves inside batch() are synced together when the block exits"""
+    from backend.services.daw import composition_service as module
+    synced = []
+    monkeypatch.setattr(module.os, "fsync", lambda fd: synced.append(fd))
+
+    with composition_service.batch():
+        composition_service.save_composition(composition)
+        composition_service.save_composition(composition)
+        assert synced == []
+
+    assert synced
+    assert composition_service.load_composition(composition.id) is not None
+
+
+def test_chat_history_kept_in_sidecar(composition_service, composition):
+    """Test that chat history is stored outside current.json and loaded on demand"""
+    composition.chat_history = [ChatMessage(role="user", content="make it faster")]
+    composition_service.save_composition(composition, create_history=False)
+
+    current = orjson.loads((composition_service.storage_dir / composition.id / "current.json").read_bytes())
+    assert "chat_history" not in current
+
+    # Saving a composition loaded without its chat must not wipe the sidecar
+    without_chat = composition_service.load_composition(composition.id)
+    assert without_chat.chat_history == []
+    composition_service.save_composition(without_chat, create_history=False)
+
+    with_chat = composition_service.load_composition(composition.id, with_chat=True)
+    assert [m.content for m in with_chat.chat_history] == ["make it faster"]
+
+
+def test_chat_history_rewritten_when_content_changes(composition_service, composition):
+    """Test that a cleared chat regrown to the same length still reaches the sidecar"""
+    composition.chat_history = [ChatMessage(role="user", content="make it faster")]
+    composition_service.save_composition(composition, create_history=False)
+
+    composition.chat_history = [ChatMessage(role="user", content="make it slower")]
+    composition_service.save_composition(composition, create_history=False)
+
+    loaded = composition_service.load_composition(composition.id, with_chat=True)
+    assert [m.content for m in loaded.chat_history] == ["make it slower"]
+
+
+def test_restore_version_restores_its_chat(composition_service, composition):
+    """Test that history snapshots carry the chat so a restore brings it back"""
+    composition.chat_history = [ChatMessage(role="user", content="first idea")]
+    composition_service.save_composition(composition)
+    composition.chat_history = [ChatMessage(role="user", content="second idea")]
+    composition_service.save_composition(composition)
+
+    # A save without the chat loaded still snapshots the sidecar's chat
+    composition_service.save_composition(composition_service.load_composition(composition.id))
+    assert [m.content for m in composition_service.load_history_version(composition.id, 2).chat_history] == ["second idea"]
+
+    assert composition_service.restore_version(composition.id, 0)
+    restored = composition_service.load_composition(composition.id, with_chat=True)
+    assert [m.content for m in restored.chat_history] == ["first idea"]
+
+
+def test_history_versions(composition_service, composition):
+    """Test that each manual save creates a loadable history version"""
+    composition_service.save_composition(composition)
+    composition.tempo = 140.0
+    composition_service.save_composition(composition)
+
+    history = composition_service.get_history(composition.id)
+    assert [entry["version"] for entry in history] == [0, 1]
+
+    assert composition_service.load_history_version(composition.id, 0).tempo == 100.0
+    assert composition_service.load_history_version(composition.id, 1).tempo == 140.0
+
+
+def test_history_stores_deltas_between_keyframes(composition_service, composition):
+    """Test that history saves deltas and rebuilds every version from them"""
+    pytest.importorskip("bsdiff4")
+    from backend.services.daw.composition_service import HISTORY_KEYFRAME_INTERVAL
+
+    tempos = [100.0 + i for i in range(HISTORY_KEYFRAME_INTERVAL + 2)]
+    for tempo in tempos:
+        composition.tempo = tempo
+        composition_service.save_composition(composition)
+
+    suffixes = [entry["filename"].split(".", 1)[1]
+                for entry in composition_service.get_history(composition.id)]
+    assert suffixes[0] == "manifest.json"
+    assert suffixes[1] == "patch"
+    assert suffixes[HISTORY_KEYFRAME_INTERVAL] == "manifest.json"
+
+    for version, tempo in enumerate(tempos):
+        assert composition_service.load_history_version(composition.id, version).tempo == tempo
+
+
+def test_history_delta_diffs_against_cached_previous_version(composition_service, composition, monkeypatch):
+    """Test that consecutive saves diff against the cached previous version, not a rebuild from disk"""
+    composition_service.save_composition(composition)
+    monkeypatch.setattr(composition_service, "_read_history_bytes", lambda *args: pytest.fail("rebuilt from disk"))
+
+    for tempo in (110.0, 120.0):
+        composition.tempo = tempo
+        composition_service.save_composition(composition)
+
+    monkeypatch.undo()
+    assert composition_service.load_history_version(composition.id, 2).tempo == 120.0
+
+
+@pytest.mark.parametrize("bsdiff", [True, False])
+def test_history_rebuilds_exact_bytes_with_large_floats(composition_service, composition, monkeypatch, bsdiff):
+    """Test that every version rebuilds exactly when serializers disagree on float formatting"""
+    from backend.services.daw import composition_service as module
+    if not bsdiff:
+        pytest.importorskip("jsonpatch")
+        monkeypatch.setattr(module, "BSDIFF_AVAILABLE", False)
+
+    composition.metadata = {"seed": 1e20}
+    saved = []
+    for tempo in (100.0, 110.0, 120.0, 130.0):
+        composition.tempo = tempo
+        composition_service.save_composition(composition)
+        saved.append(composition.model_dump(mode="json"))
+
+    # Rebuild from disk, not from the in-memory tail
+    fresh = CompositionService(storage_dir=composition_service.storage_dir, samples_dir=composition_service.samples_dir)
+    for version, expected in enumerate(saved):
+        assert fresh.load_history_version(composition.id, version).model_dump(mode="json") == expected
+
+
+def test_history_falls_back_to_json_patch(composition_service, composition, monkeypatch):
+    """Test that history uses JSON Patch deltas when bsdiff4 is unavailable"""
+    pytest.importorskip("jsonpatch")
+    from backend.services.daw import composition_service as module
+    monkeypatch.setattr(module, "BSDIFF_AVAILABLE", False)
+
+    for tempo in (100.0, 110.0, 120.0):
+        composition.tempo = tempo
+        composition_service.save_composition(composition)
+
+    history = composition_service.get_history(composition.id)
+    assert history[1]["filename"].endswith(".patch.json")
+    assert composition_service.load_history_version(composition.id, 2).tempo == 120.0
+
+
+def test_history_keyframes_share_unchanged_chunks(composition_service, composition):
+    """Test that keyframes store unchanged fields as one shared chunk"""
+    from backend.services.daw.composition_service import HISTORY_KEYFRAME_INTERVAL
+
+    for tempo in range(HISTORY_KEYFRAME_INTERVAL + 1):
+        composition.tempo = 100.0 + tempo
+        composition_service.save_composition(composition)
+
+    history_dir = composition_service.storage_dir / composition.id / "history"
+    first, last = [orjson.loads(path.read_bytes())["segments"] for path in sorted(history_dir.glob("*.manifest.json"))]
+
+    def chunks(segments):
+        return {segment["field"]: segment["chunk"] for segment in segments if isinstance(segment, dict)}
+
+    assert chunks(first)["clips"] == chunks(last)["clips"]
+    assert '  "tempo": 100.0,\n' in first
+    assert '  "tempo": 110.0,\n' in last
+
+
+def test_history_counter_recovers_when_missing(composition_service, composition):
+    """Test that version numbering continues when history/.next is missing"""
+    composition_service.save_composition(composition)
+    composition_service.save_composition(composition)
+    (composition_service.storage_dir / composition.id / "history" / ".next").unlink()
+
+    composition_service.save_composition(composition)
+
+    history = composition_service.get_history(composition.id)
+    assert [entry["version"] for entry in history] == [0, 1, 2]
+
+
+def test_history_counter_never_reuses_versions(composition_service, composition):
+    """Test that a missing or stale history/.next skips versions already on disk"""
+    for _ in range(3):
+        composition_service.save_composition(composition)
+    history_dir = composition_service.storage_dir / composition.id / "history"
+    (history_dir / ".next").write_text("1")  # Stale: crash after writing entry 2
+
+    fresh = CompositionService(
+        storage_dir=composition_service.storage_dir,
+        samples_dir=composition_service.samples_dir
+    )
+    fresh.save_composition(composition)
+
+    assert [entry["version"] for entry in fresh.get_history(composition.id)] == [0, 1, 2, 3]
+
+
+def test_delete_composition(composition_service, composition):
+    """Test that deleting removes the composition from listings"""
+    composition_service.save_composition(composition)
+
+    assert composition_service.delete_composition(composition.id) is True
+    assert composition_service.list_compositions() == []
+    assert composition_service.load_composition(composition.id) is None
+
+
+def test_list_compositions_without_sidecar(composition_service, composition):
+    """Test that listing falls back to current.json when the sidecar is missing"""
+    composition_service.save_composition(composition)
+    (composition_service.storage_dir / composition.id / "metadata.json").unlink()
+
+    [meta] = composition_service.list_compositions()
+    assert meta.tempo == 100.0
+    assert meta.track_count == 1
+    assert meta.clip_count == 2
+    assert meta.duration_beats == 12.0
+
+
+def test_auto_persist_is_coalesced_until_flush(composition_service, composition):
+    """Test that auto-persist queues writes and flushes them once"""
+    state_service = SimpleNamespace(get_composition=lambda composition_id: composition)
+    mixer_service = SimpleNamespace(state=MixerState())
+    effects_service = SimpleNamespace(get_track_effect_chain=lambda track_id: None)
+    current_file = composition_service.storage_dir / composition.id / "current.json"
+
+    for tempo in (110.0, 120.0, 130.0):
+        composition.tempo = tempo
+        assert composition_service.auto_persist_composition(
+            composition.id, state_service, mixer_service, effects_service
+        )
+    assert not current_file.exists()
+
+    composition_service.flush_pending_persists()
+
+    assert current_file.exists()
+    assert composition_service.load_composition(composition.id).tempo == 130.0
@@ -0,0 +1,113 @@
+"""
+Tests for OSC sending (AudioEngineManager)
+"""
+import pytest
+from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from backend.core import engine_manager as module
+from backend.core.engine_manager import AudioEngineManager, _is_release
+
+
+class FakeClient:
+    """Stands in for the scsynth UDP client, recording sent packets"""
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    def send(self, content):
+        if self.fail:
+            raise OSError("network unreachable")
+        self.sent.append(content.dgram)
+
+
+@pytest.fixture
+def engine() -> AudioEngineManager:
+    """Connected engine manager whose writer thread is not running (packets stay queued)"""
+    manager = AudioEngineManager()
+    manager.scsynth_client = FakeClient()
+    manager.is_connected = True
+    return manager
+
+
+def queued(manager: AudioEngineManager) -> list:
+    """Datagrams waiting for the writer thread"""
+    return [content.dgram for content in list(manager._send_queue.queue)]
+
+
+def test_sample_player_template_matches_builder(engine):
+    """Test that the pre-encoded samplePlayer /s_new is byte-identical to OscMessageBuilder output"""
+    engine.send_sample_player(3001, 0, 1, bufnum=12, rate=1.5, amp=0.8, start_pos=0.0, end_pos=1.0,
+                              fade_in=0.01, fade_out=0.05, reverse=0, loop=1, gate=1, out=16)
+
+    builder = OscMessageBuilder(address="/s_new")
+    for arg in ["samplePlayer", 3001, 0, 1,
+                "bufnum", 12, "rate", 1.5, "amp", 0.8, "startPos", 0.0, "endPos", 1.0,
+                "fadeIn", 0.01, "fadeOut", 0.05, "reverse", 0, "loop", 1, "gate", 1, "out", 16]:
+        builder.add_arg(arg)
+
+    assert queued(engine) == [builder.build().dgram]
+
+
+def test_send_bundle_carries_timetag_and_messages(engine):
+    """Test that send_bundle queues one bundle with every message in order"""
+    engine.send_bundle(1_700_000_000.5, [("/s_new", ["sine", 3001, 0, 1]), ("/n_set", [3001, "gate", 0])])
+
+    [dgram] = queued(engine)
+    bundle = OscBundle(dgram)
+    assert bundle.timestamp == pytest.approx(1_700_000_000.5, abs=1e-6)
+    assert [(message.address, message.params) for message in bundle] == [
+        ("/s_new", ["sine", 3001, 0, 1]),
+        ("/n_set", [3001, "gate", 0]),
+    ]
+
+
+def test_is_release():
+    """Test which messages count as releases that must never be dropped"""
+    assert _is_release("/n_free", [3001, 3002])
+    assert _is_release("/n_set", [3001, "gate", 0])
+    assert _is_release("/n_set", [3001, "amp", 0.5, "gate", 0])
+    assert not _is_release("/n_set", [3001, "gate", 1])
+    assert not _is_release("/n_set", [3001, "amp", 0])
+    assert not _is_release("/s_new", ["sine", 3001, 0, 1, "gate", 0])
+
+
+def test_releases_are_queued_past_the_limit(engine, monkeypatch):
+    """Test that a full queue drops ordinary sends but never releases or frees"""
+    monkeypatch.setattr(module, "OSC_SEND_QUEUE_SIZE", 1)
+
+    engine.send_message("/s_new", "sine", 3001, 0, 1)
+    engine.send_message("/s_new", "sine", 3002, 0, 1)
+    engine.send_message("/n_set", 3001, "gate", 0)
+    engine.send_message("/n_free", 3001)
+    engine.send_bundle(None, [("/n_free", [3002])])
+
+    assert engine.dropped_send_count == 1
+    addresses = [OscMessage(dgram).address if not OscBundle.dgram_is_bundle(dgram) else "#bundle"
+                 for dgram in queued(engine)]
+    assert addresses == ["/s_new", "/n_set", "/n_free", "#bundle"]
+
+
+def test_writer_thread_sends_in_order(engine):
+    """Test that the writer thread drains the queue in order before stopping"""
+    for node_id in (3001, 3002, 3003):
+        engine.send_message("/n_free", node_id)
+
+    engine._start_writer()
+    engine._stop_writer()
+
+    assert [OscMessage(dgram).params for dgram in engine.scsynth_client.sent] == [[3001], [3002], [3003]]
+
+
+def test_writer_thread_counts_send_errors(engine):
+    """Test that socket errors on the writer thread are counted instead of lost"""
+    engine.scsynth_client = FakeClient(fail=True)
+    engine.send_message("/n_free", 3001)
+
+    engine._start_writer()
+    engine._stop_writer()
+
+    assert engine.send_error_count == 1
+    assert isinstance(engine.last_send_error, OSError)
@@ -0,0 +1,115 @@
+"""
+Tests for timeline MIDI scheduling (PlaybackEngineService)
+"""
+import asyncio
+import time
+
+import pytest
+
+from backend.models.sequence import Clip, MIDINote, Track
+from backend.services.daw.playback_engine_service import PlaybackEngineService
+
+
+class FakeEngineManager:
+    """Stands in for AudioEngineManager, recording every bundle sent"""
+
+    def __init__(self):
+        self.next_node_id = 3000
+        self.bundles = []
+
+    def allocate_node_id(self) -> int:
+        self.next_node_id += 1
+        return self.next_node_id
+
+    def send_bundle(self, timetag, messages):
+        self.bundles.append((timetag, messages))
+
+    def send_message(self, address, *args):
+        self.bundles.append((None, [(address, list(args))]))
+
+    def sent(self, address: str) -> list:
+        """Node IDs of every message sent to this address, in order"""
+        return [
+            args[1] if address == "/s_new" else args[0]
+            for _, messages in self.bundles
+            for message_address, args in messages
+            if message_address == address
+        ]
+
+
+@pytest.fixture
+def engine_manager() -> FakeEngineManager:
+    return FakeEngineManager()
+
+
+@pytest.fixture
+def playback(engine_manager) -> PlaybackEngineService:
+    """Playback engine at 600 BPM (0.1 s per beat)"""
+    service = PlaybackEngineService(composition_state_service=None, engine_manager=engine_manager)
+    service.tempo = 600.0
+    return service
+
+
+def midi_clip(*notes) -> Clip:
+    """MIDI clip from (start_beat, duration_beats) pairs"""
+    return Clip(
+        id="clip-1", name="A", type="midi", track_id="track-1", start_time=0.0, duration=16.0,
+        midi_events=[
+            MIDINote(note=60, note_name="C4", start_time=start, duration=duration)
+            for start, duration in notes
+        ],
+    )
+
+
+TRACK = Track(id="track-1", name="Lead", composition_id="comp-1", type="midi")
+
+
+async def test_every_onset_is_sent_with_its_release(playback, engine_manager):
+    """Test that each /s_new bundle goes out together with the release of the same notes"""
+    await playback._trigger_clip(midi_clip((0.0, 1.0), (2.0, 1.0), (2.0, 0.5)), TRACK)
+
+    # Only the first group is inside the lookahead
+    assert engine_manager.sent("/s_new") == [3001]
+
+    await asyncio.sleep(0.4)
+
+    assert sorted(engine_manager.sent("/s_new")) == [3001, 3002, 3003]
+    for index, (_, messages) in enumerate(engine_manager.bundles):
+        started = [args[1] for address, args in messages if address == "/s_new"]
+        if started:
+            released = {args[0] for _, later in engine_manager.bundles[index + 1:index + 3] for _, args in later}
+            assert set(started) <= released
+    assert not playback.timeline_note_timers
+
+
+async def test_cancel_frees_sent_notes_and_drops_unsent(playback, engine_manager):
+    """Test that a cancel frees notes already on scsynth by node ID and never sends the rest"""
+    await playback._trigger_clip(midi_clip((0.0, 10.0), (1.5, 10.0), (5.0, 10.0)), TRACK)
+    await asyncio.sleep(0.1)
+
+    # 3001 is sounding, 3002 is sent but not started, 3003 is still in the future
+    assert 3001 in playback.timeline_active_midi_notes
+    assert engine_manager.sent("/s_new") == [3001, 3002]
+
+    engine_manager.bundles.clear()
+    playback._cancel_scheduled_midi_notes()
+
+    [(timetag, messages)] = engine_manager.bundles
+    assert messages == [("/n_free", [3002])]
+    assert timetag > time.time()
+    assert not playback.timeline_note_timers
+
+    await asyncio.sleep(0.5)
+    assert engine_manager.sent("/s_new") == []
+
+
+async def test_fired_timers_are_dropped_while_notes_overlap(playback):
+    """Test that the timer set shrinks as timers fire even while a long note keeps sounding"""
+    await playback._trigger_clip(midi_clip((0.0, 16.0), (0.5, 0.5), (1.0, 0.5), (1.5, 0.5)), TRACK)
+    scheduled_timers = len(playback.timeline_note_timers)
+
+    await asyncio.sleep(0.25)
+
+    assert playback.timeline_scheduled_notes
+    assert scheduled_timers > 1
+    assert len(playback.timeline_note_timers) == 1  # only the pad's release is left